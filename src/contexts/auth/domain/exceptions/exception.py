@@ -6,6 +6,8 @@ from src.shared.domain.exceptions.exception import BaseDomainException
 class InvalidEmailException(BaseDomainException):
     """Exception raised for invalid email addresses."""
 
+    MESSAGE = "Invalid email address provided"
+
     def __init__(self, email: str, errors: list[str]) -> None:
         """Initialize the InvalidEmailException.
 
@@ -15,12 +17,14 @@ class InvalidEmailException(BaseDomainException):
         """
         self.email = email
         self.errors = errors
-        super().__init__("Invalid email address provided")
+        super().__init__(self.MESSAGE)
 
 
 class InvalidPasswordHashException(BaseDomainException):
     """Exception raised for invalid password hashes."""
 
+    MESSAGE = "Invalid password hash provided"
+
     def __init__(self, *errors: str) -> None:
         """Initialize the InvalidPasswordHashException.
 
@@ -28,12 +32,14 @@ class InvalidPasswordHashException(BaseDomainException):
             *errors (str): Variable length error messages describing the validation issues.
         """
         self.errors = errors
-        super().__init__("Invalid password hash provided")
+        super().__init__(self.MESSAGE)
 
 
 class InvalidPasswordException(BaseDomainException):
     """Exception raised for invalid passwords."""
 
+    MESSAGE = "The password does not meet the security criteria"
+
     def __init__(self, errors: list[str]) -> None:
         """Initialize the InvalidPasswordException.
 
@@ -41,7 +47,7 @@ class InvalidPasswordException(BaseDomainException):
             errors (list[str]): Variable length error messages describing the validation issues.
         """
         self.errors = errors
-        super().__init__("The password does not meet the security criteria")
+        super().__init__(self.MESSAGE)
 
 
 class EmailAlreadyExistsException(BaseDomainException):
@@ -103,34 +109,42 @@ class UserNotFoundException(BaseDomainException):
 class ActivationCodeExpiredException(BaseDomainException):
     """Exception raised when an activation code has expired."""
 
+    MESSAGE = "The activation code has expired"
+
     def __init__(self) -> None:
         """Initialize the ActivationCodeExpiredException."""
-        super().__init__("The activation code has expired")
+        super().__init__(self.MESSAGE)
 
 
 class InvalidActivationCodeException(BaseDomainException):
     """Exception raised when an activation code is invalid."""
 
+    MESSAGE = "The activation code is invalid"
+
     def __init__(self) -> None:
         """Initialize the InvalidActivationCodeException."""
-        super().__init__("The activation code is invalid")
+        super().__init__(self.MESSAGE)
 
 
 class InvalidCredentialsException(BaseDomainException):
     """Exception raised for invalid credentials."""
 
+    MESSAGE = "Invalid credentials provided"
+
     def __init__(self) -> None:
         """Initialize the InvalidCredentialsException.
 
         Args:
             errors (str): Variable length error messages describing the validation issues.
         """
-        super().__init__("Invalid credentials provided")
+        super().__init__(self.MESSAGE)
 
 
 class AccountTemporarilyBlockedException(BaseDomainException):
     """Exception raised for account temporarily blocked."""
 
+    MESSAGE = "Account temporarily blocked provided"
+
     def __init__(self, error: str) -> None:
         """Initialize the AccountTemporarilyBlockedException.
 
@@ -138,78 +152,94 @@ class AccountTemporarilyBlockedException(BaseDomainException):
             error (str): Variable length error messages describing the validation issues.
         """
         self.error = error
-        super().__init__("Account temporarily blocked provided")
+        super().__init__(self.MESSAGE)
 
 
 class UserInactiveException(BaseDomainException):
     """Exception raised when a user account is inactive."""
 
+    MESSAGE = "The user account is inactive"
+
     def __init__(self) -> None:
         """Initialize the UserInactiveException."""
-        super().__init__("The user account is inactive")
+        super().__init__(self.MESSAGE)
 
 
 class AdminUserAlreadyExistsException(BaseDomainException):
     """Exception raised when an admin user already exists in the system."""
 
+    MESSAGE = "An admin user already exists in the system"
+
     def __init__(self) -> None:
         """Initialize the AdminUserAlreadyExistsException."""
-        super().__init__("An admin user already exists in the system")
+        super().__init__(self.MESSAGE)
 
 
 class PatientProfileAlreadyExistsException(BaseDomainException):
     """Exception raised when a patient profile already exists for a user."""
 
+    MESSAGE = "A patient profile already exists for this user"
+
     def __init__(self) -> None:
         """Initialize the PatientProfileAlreadyExistsException."""
-        super().__init__("A patient profile already exists for this user")
+        super().__init__(self.MESSAGE)
 
 
 class PatientDocumentAlreadyRegisteredException(BaseDomainException):
     """Exception raised when a patient document is already registered in the system."""
 
+    MESSAGE = "Patient document already registered"
+
     def __init__(self) -> None:
         """Initialize the PatientDocumentAlreadyRegisteredException."""
-        super().__init__("Patient document already registered")
+        super().__init__(self.MESSAGE)
 
 
 class PatientPhoneAlreadyRegisteredException(BaseDomainException):
     """Exception raised when a patient phone number is already registered in the system."""
 
+    MESSAGE = "Patient phone number already registered"
+
     def __init__(self) -> None:
         """Initialize the PatientPhoneAlreadyRegisteredException."""
-        super().__init__("Patient phone number already registered")
+        super().__init__(self.MESSAGE)
 
 
 class DoctorProfileAlreadyExistsException(BaseDomainException):
     """Exception raised when a doctor profile already exists for a user."""
 
+    MESSAGE = "A doctor profile already exists for this user"
+
     def __init__(self) -> None:
         """Initialize the DoctorProfileAlreadyExistsException."""
-        super().__init__("A doctor profile already exists for this user")
+        super().__init__(self.MESSAGE)
 
 
 class DoctorLicenseNumberAlreadyRegisteredException(BaseDomainException):
     """Exception raised when a doctor license number is already registered in the system."""
 
+    MESSAGE = "Doctor license number already registered"
+
     def __init__(self) -> None:
         """Initialize the DoctorLicenseNumberAlreadyRegisteredException."""
-        super().__init__("Doctor license number already registered")
+        super().__init__(self.MESSAGE)
 
 
 class NewPasswordEqualsCurrentException(BaseDomainException):
     """Exception raised when a new password equal current."""
 
+    MESSAGE = "The new password cannot be the same as the current one"
+
     def __init__(self) -> None:
         """Initialize the NewPasswordEqualCurrentException."""
-        super().__init__("The new password cannot be the same as the current one")
+        super().__init__(self.MESSAGE)
 
 
 class CurrentPasswordIncorrectException(BaseDomainException):
     """Exception raised when a current password incorrect exception."""
 
+    MESSAGE = "The current password entered does not match the one registered"
+
     def __init__(self) -> None:
         """Initialize the CurrentPasswordIncorrectException."""
-        super().__init__(
-            "The current password entered does not match the one registered"
-        )
+        super().__init__(self.MESSAGE)
@@ -46,19 +46,15 @@ class AccessTokenVO(BaseValueObject):
         if self.expires_at <= datetime.now(UTC):
             raise ValueError("expires_at must be in the future")
 
-    @classmethod
-    def to_dict(cls, token: "AccessTokenVO") -> dict:
+    def to_dict(self) -> dict:
         """Convert AccessTokenVO to dictionary.
 
-        Args:
-            token (AccessTokenVO): The access token value object.
-
         Returns:
             dict: Dictionary representation of the access token.
         """
         return {
-            "access_token": token.access_token,
-            "token_type": token.token_type,
-            "expires_at": token.expires_at,
-            "expires_in": token.expires_in,
+            "access_token": self.access_token,
+            "token_type": self.token_type,
+            "expires_at": self.expires_at,
+            "expires_in": self.expires_in,
         }
@@ -6,6 +6,10 @@ from dataclasses import dataclass
 from src.contexts.auth.domain.exceptions.exception import InvalidEmailException
 from src.shared.domain.value_objects.value_object import BaseValueObject
 
+_EMAIL_RE = re.compile(
+    r"^[a-zA-Z0-9_.+-]+@([a-zA-Z0-9]+(-[a-zA-Z0-9]+)*\.)+[a-zA-Z]{2,6}$"
+)
+
 
 @dataclass(frozen=True)
 class EmailVO(BaseValueObject):
@@ -27,14 +31,11 @@ class EmailVO(BaseValueObject):
             InvalidEmailException: If the email format is invalid.
         """
         errors = []
-        EMAIL_PATTERN = (
-            r"^[a-zA-Z0-9_.+-]+@([a-zA-Z0-9]+(-[a-zA-Z0-9]+)*\.)+[a-zA-Z]{2,6}$"
-        )
         if any(w in self.email for w in (" ", "\t", "\n")):
             errors.append("Email must not contain whitespace.")
         if ".." in self.email:
             errors.append("Email must not contain consecutive dots.")
-        if not re.match(EMAIL_PATTERN, self.email):
+        if not _EMAIL_RE.match(self.email):
             errors.append("Invalid email format.")
         if len(self.email) > 255:
             errors.append("Email too long.")
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from src.contexts.auth.domain.exceptions.exception import InvalidPasswordHashException
 from src.shared.domain.value_objects.value_object import BaseValueObject
 
+_BCRYPT_RE = re.compile(r"^\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}$")
+
 
 @dataclass(frozen=True)
 class PasswordHashVO(BaseValueObject):
@@ -27,11 +29,10 @@ class PasswordHashVO(BaseValueObject):
             InvalidPasswordHashException: If the password hash is invalid.
         """
         errors = []
-        BCRYPT_PATTERN = r"^\$2[aby]\$\d{2}\$[./A-Za-z0-9]{53}$"
 
         if not self.password_hash:
             errors.append("Password hash cannot be empty.")
-        if not re.match(BCRYPT_PATTERN, self.password_hash):
+        if not _BCRYPT_RE.match(self.password_hash):
             errors.append("Invalid bcrypt hash format.")
 
         if errors:
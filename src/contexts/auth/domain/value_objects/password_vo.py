@@ -5,6 +5,8 @@ from dataclasses import dataclass
 from src.contexts.auth.domain.exceptions.exception import InvalidPasswordException
 from src.shared.domain.value_objects.value_object import BaseValueObject
 
+_SPECIAL_CHARS = frozenset("!@#$%^&*()-_=+[]{}|;:,.<>?/\\")
+
 
 @dataclass(frozen=True)
 class PasswordVO(BaseValueObject):
@@ -26,7 +28,6 @@ class PasswordVO(BaseValueObject):
             InvalidPasswordException: If the password does not meet the security criteria.
         """
         errors = []
-        SPECIAL_CHARS = "!@#$%^&*()-_=+[]{}|;:,.<>?/\\"
         if len(self.password) < 8:
             errors.append("Password must be at least 8 characters long.")
         if not any(c.isupper() for c in self.password):
@@ -35,7 +36,7 @@ class PasswordVO(BaseValueObject):
             errors.append("Password must contain at least one lowercase character.")
         if not any(c.isdigit() for c in self.password):
             errors.append("Password must contain at least one numeric character.")
-        if not any(c in SPECIAL_CHARS for c in self.password):
+        if not any(c in _SPECIAL_CHARS for c in self.password):
             errors.append("Password must contain at least one special character.")
 
         if errors:
@@ -38,12 +38,11 @@ from src.shared.infrastructure.notifications.template_renderer_service_adapter i
 logger = get_logger(settings.LOG_LEVEL)
 
 
-def create_initial_admin() -> None:
-    """Create the initial admin user based on configuration settings.
+def build_create_admin_use_case() -> CreateAdminUseCase:
+    """Wire the create admin use case with its infrastructure adapters.
 
-    Raises:
-        AdminUserAlreadyExistsException: If an admin user already exists.
-        EmailAlreadyExistsException: If the email for the admin user already exists.
+    Returns:
+        CreateAdminUseCase: The use case built from configuration settings.
     """
     # Initialize services and repositories
     user_repository = SQLModelRepositoryAdapter(next(get_session()), logger)
@@ -63,8 +62,7 @@ def create_initial_admin() -> None:
         settings.ALLOWED_STAFF_EMAIL_DOMAINS, settings.ALLOWED_STAFF_ROLES
     )
 
-    # Create the use case and execute it
-    use_case = CreateAdminUseCase(
+    return CreateAdminUseCase(
         user_repository,
         password_hash_service,
         password_service,
@@ -72,6 +70,23 @@ def create_initial_admin() -> None:
         template_renderer_service,
         staff_email_policy_service,
     )
+
+
+def create_initial_admin(use_case: CreateAdminUseCase | None = None) -> None:
+    """Create the initial admin user based on configuration settings.
+
+    Args:
+        use_case (CreateAdminUseCase | None): The use case to execute. Defaults to
+            the one wired by build_create_admin_use_case().
+
+    Raises:
+        AdminUserAlreadyExistsException: If an admin user already exists.
+        EmailAlreadyExistsException: If the email for the admin user already exists.
+    """
+    if use_case is None:
+        use_case = build_create_admin_use_case()
+
+    # Execute the use case
     command = CreateAdminCommand(
         settings.INITIAL_ADMIN_FIRST_NAME,
         settings.INITIAL_ADMIN_LAST_NAME,
@@ -1,6 +1,7 @@
 """This module contains the logging service implementation."""
 
-import inspect
+import sys
+from typing import TextIO
 
 from src.shared.infrastructure.logging.logging_config import LoggingConfig
 
@@ -15,20 +16,20 @@ def get_caller_module_name(skip_frames: int = 2) -> str:
         str: The name of the calling module, or "__main__" if not found.
     """
     try:
-        # Get the current stack frames
-        frames = inspect.stack()
+        # Start from the frame skip_frames levels up the call stack
+        frame = sys._getframe(skip_frames)
+    except ValueError:
+        # The call stack is not deep enough
+        frame = None
 
-        # Iterate through the stack frames,
-        # skipping the specified number of frames
-        for frame in frames[skip_frames:]:
-            # get the module from the frame
-            module = inspect.getmodule(frame[0])
+    # Walk back through the callers
+    while frame is not None:
+        module_name = frame.f_globals.get("__name__")
 
-            # if module is found, and it's not this module, return its name
-            if module and module.__name__ != __name__:
-                return module.__name__
-    except (IndexError, AttributeError):
-        pass
+        # if module is found, and it's not this module, return its name
+        if module_name and module_name != __name__:
+            return module_name
+        frame = frame.f_back
 
     # Fallback to __main__ if no other module is found
     return "__main__"
@@ -37,14 +38,16 @@ def get_caller_module_name(skip_frames: int = 2) -> str:
 class Logger:
     """Service to handle logger."""
 
-    def __init__(self, level: str):
+    def __init__(self, level: str, stream: TextIO | None = None):
         """Initialize the Logger instance.
 
         Args:
             level (str): The logging level.
+            stream (TextIO | None): Stream the log lines are written to.
+                Defaults to standard output.
         """
         name = get_caller_module_name()
-        self.logger = LoggingConfig.configure(level=level, name=name)
+        self.logger = LoggingConfig.configure(level=level, name=name, stream=stream)
 
     def debug(self, message: str, **kwargs):
         """Log a debug message with optional contextual information."""
@@ -67,13 +70,15 @@ class Logger:
         self.logger.critical(message, **kwargs)
 
 
-def get_logger(level: str) -> Logger:
+def get_logger(level: str, stream: TextIO | None = None) -> Logger:
     """Provides a Logger instance.
 
     Args:
         level (str): The logging level.
+        stream (TextIO | None): Stream the log lines are written to.
+            Defaults to standard output.
 
     Returns:
         Logger: An instance of the logger.
     """
-    return Logger(level)
+    return Logger(level, stream)
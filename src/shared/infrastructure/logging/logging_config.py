@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from typing import TextIO
 
 import structlog
 
@@ -10,12 +11,16 @@ class LoggingConfig:
     """Logging configuration class."""
 
     @staticmethod
-    def configure(level: str, name: str) -> structlog.BoundLogger:
+    def configure(
+        level: str, name: str, stream: TextIO | None = None
+    ) -> structlog.BoundLogger:
         """Configures the logging settings.
 
         Args:
             level (str): The logging level.
             name (str): The name of the logger.
+            stream (TextIO | None): Stream the log lines are written to.
+                Defaults to standard output.
 
         Returns:
             logger (structlog.BoundLogger): Configured logger instance.
@@ -41,7 +46,7 @@ class LoggingConfig:
                 logging.getLevelName(level)
             ),
             context_class=dict,
-            logger_factory=structlog.PrintLoggerFactory(),
+            logger_factory=structlog.PrintLoggerFactory(stream),
             cache_logger_on_first_use=True,
         )
 
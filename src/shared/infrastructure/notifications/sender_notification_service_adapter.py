@@ -1,6 +1,7 @@
 """This module contains the adapter for sending notifications via SMTP email."""
 
 import smtplib
+from collections.abc import Callable
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -21,6 +22,7 @@ class SenderNotificationServiceAdapter(SenderNotificationServicePort):
         user_email: str,
         user_password: str,
         logger: Logger,
+        smtp_factory: Callable[[str, int], smtplib.SMTP] = smtplib.SMTP,
     ) -> None:
         """Initializes the notification sender with SMTP server details.
 
@@ -30,12 +32,15 @@ class SenderNotificationServiceAdapter(SenderNotificationServicePort):
             user_email (str): The email address to send from.
             user_password (str): The password for the email account.
             logger (Logger): Logger instance for logging.
+            smtp_factory (Callable[[str, int], smtplib.SMTP]): Builds the SMTP
+                connection from the server address and port.
         """
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
         self.user_email = user_email
         self.user_password = user_password
         self.logger = logger
+        self.smtp_factory = smtp_factory
 
     def send(self, notification: SendNotificationVO) -> None:
         """Sends an email notification.
@@ -55,7 +60,7 @@ class SenderNotificationServiceAdapter(SenderNotificationServicePort):
         message.attach(html)
 
         try:
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            server = self.smtp_factory(self.smtp_server, self.smtp_port)
             server.starttls()
             server.login(self.user_email, self.user_password)
             server.sendmail(
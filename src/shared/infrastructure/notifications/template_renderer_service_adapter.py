@@ -20,19 +20,52 @@ class TemplateRendererServiceAdapter(
     """Adapter for rendering templates using Jinja2."""
 
     def __init__(
-        self, templates_path: str, value_class: type[TemplateRendererContextType]
+        self,
+        templates_path: str | None,
+        value_class: type[TemplateRendererContextType],
+        *,
+        environment: Environment | None = None,
     ) -> None:
         """Initializes the template renderer with the given templates path.
 
         Args:
-            templates_path (str): The file system path to the templates directory.
+            templates_path (str | None): The file system path to the templates
+                directory. Must be None when environment is given.
             value_class (type[TemplateRendererContextType]): The class type for the context.
+            environment (Environment | None): A pre-built Jinja2 environment to share
+                compiled templates across renderers.
+
+        Raises:
+            ValueError: If both or neither of templates_path and environment are given.
         """
+        if (templates_path is None) == (environment is None):
+            raise ValueError("Provide exactly one of templates_path or environment")
+
         self.value_class = value_class
-        self.env = Environment(
-            loader=FileSystemLoader(templates_path),
-            autoescape=select_autoescape(["html"]),
-        )
+
+        if environment is None:
+            environment = Environment(
+                loader=FileSystemLoader(templates_path),
+                autoescape=select_autoescape(["html"]),
+            )
+        self.env = environment
+
+    @classmethod
+    def from_environment(
+        cls,
+        environment: Environment,
+        value_class: type[TemplateRendererContextType],
+    ) -> "TemplateRendererServiceAdapter[TemplateRendererContextType]":
+        """Create a template renderer on a pre-built Jinja2 environment.
+
+        Args:
+            environment (Environment): The Jinja2 environment to render with.
+            value_class (type[TemplateRendererContextType]): The class type for the context.
+
+        Returns:
+            TemplateRendererServiceAdapter[TemplateRendererContextType]: The template renderer.
+        """
+        return cls(None, value_class, environment=environment)
 
     def render(self, template: TemplateRendererVO[TemplateRendererContextType]) -> str:
         """Renders a template with the given context.
@@ -0,0 +1,29 @@
+import pytest
+
+
+class _CaptureUseCase:
+    """Minimal use-case stand-in that records the last command it executed."""
+
+    __slots__ = ("cmd", "calls", "side_effect", "return_value")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.cmd = None
+        self.calls = 0
+        self.side_effect: Exception | None = None
+        self.return_value = None
+
+    def execute(self, cmd):
+        self.cmd = cmd
+        self.calls += 1
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+@pytest.fixture(scope="class")
+def capture_use_case():
+    """Provide a use-case stand-in shared by the tests of one class."""
+    return _CaptureUseCase()
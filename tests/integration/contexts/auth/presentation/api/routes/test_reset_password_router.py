@@ -1,5 +1,6 @@
 """Integration tests for PUT /api/auth/reset-password."""
 
+import json
 from unittest.mock import MagicMock
 from uuid import uuid4
 
@@ -17,9 +18,6 @@ from src.contexts.auth.application.use_cases.password_recovery_use_case import (
 from src.contexts.auth.application.use_cases.register_user_use_case import (
     RegisterUserUseCase,
 )
-from src.contexts.auth.application.use_cases.reset_password_use_case import (
-    ResetPasswordUseCase,
-)
 from src.contexts.auth.application.use_cases.update_user_password_use_case import (
     UpdateUserPasswordUseCase,
 )
@@ -30,6 +28,14 @@ from src.contexts.auth.domain.exceptions.exception import (
     UserNotFoundException,
 )
 from src.contexts.auth.domain.value_objects.token_payload_vo import TokenPayloadVO
+from src.contexts.auth.presentation.api.compositions.use_cases_composition import (
+    get_activate_account_use_case,
+    get_login_use_case,
+    get_password_recovery_use_case,
+    get_register_user_use_case,
+    get_reset_password_use_case,
+    get_update_user_password_use_case,
+)
 from src.contexts.auth.presentation.api.exceptions.exceptions_handlers import (
     register_auth_exceptions_handlers,
 )
@@ -38,6 +44,15 @@ from src.shared.domain.exceptions.exception import (
     DatabaseConnectionException,
     UnexpectedDatabaseException,
 )
+from src.shared.presentation.api.compositions.infrastructure_composition import (
+    get_logger,
+)
+from src.shared.presentation.api.compositions.security_composition import (
+    get_current_user,
+    request_details_dependency,
+)
+
+_URL = "/api/auth/reset-password"
 
 RESET_PASSWORD_BODY = {
     "email": "user@example.com",
@@ -45,209 +60,152 @@ RESET_PASSWORD_BODY = {
     "new_password": "NewPass123!",
 }
 
+RESET_PASSWORD_BYTES = json.dumps(RESET_PASSWORD_BODY).encode()
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+_CURRENT_USER = TokenPayloadVO(
+    user_id=uuid4(),
+    role=RolesEnum.ADMIN,
+    expires_in=3600,
+    jti=uuid4(),
+)
+
+_REQUEST_DETAILS = {
+    "request_ip": "127.0.0.1",
+    "request_user_agent": "test-agent",
+}
+
+_STUB_REGISTER_USER = MagicMock(spec=RegisterUserUseCase)
+_STUB_ACTIVATE_ACCOUNT = MagicMock(spec=ActivateAccountUseCase)
+_STUB_LOGIN = MagicMock(spec=LoginUseCase)
+_STUB_PASSWORD_RECOVERY = MagicMock(spec=PasswordRecoveryUseCase)
+_STUB_UPDATE_USER_PASSWORD = MagicMock(spec=UpdateUserPasswordUseCase)
+_LOGGER = MagicMock()
+
 
-def _make_app(reset_uc: ResetPasswordUseCase | None = None) -> FastAPI:
+def _current_user() -> TokenPayloadVO:
+    return _CURRENT_USER
+
+
+def _request_details() -> dict[str, str]:
+    return _REQUEST_DETAILS
+
+
+def _logger() -> MagicMock:
+    return _LOGGER
+
+
+def _make_app() -> FastAPI:
     app = FastAPI()
     register_auth_exceptions_handlers(app)
     app.include_router(router)
 
-    from src.contexts.auth.presentation.api.compositions.use_cases_composition import (
-        get_activate_account_use_case,
-        get_login_use_case,
-        get_password_recovery_use_case,
-        get_register_user_use_case,
-        get_reset_password_use_case,
-        get_update_user_password_use_case,
+    app.dependency_overrides[get_register_user_use_case] = lambda: _STUB_REGISTER_USER
+    app.dependency_overrides[get_activate_account_use_case] = (
+        lambda: _STUB_ACTIVATE_ACCOUNT
     )
-    from src.shared.presentation.api.compositions.infrastructure_composition import (
-        get_logger,
+    app.dependency_overrides[get_login_use_case] = lambda: _STUB_LOGIN
+    app.dependency_overrides[get_password_recovery_use_case] = (
+        lambda: _STUB_PASSWORD_RECOVERY
     )
-    from src.shared.presentation.api.compositions.security_composition import (
-        get_current_user,
-        request_details_dependency,
+    app.dependency_overrides[get_update_user_password_use_case] = (
+        lambda: _STUB_UPDATE_USER_PASSWORD
     )
+    app.dependency_overrides[get_current_user] = _current_user
+    app.dependency_overrides[request_details_dependency] = _request_details
 
-    app.dependency_overrides[get_register_user_use_case] = lambda: MagicMock(
-        spec=RegisterUserUseCase
-    )
-    app.dependency_overrides[get_activate_account_use_case] = lambda: MagicMock(
-        spec=ActivateAccountUseCase
-    )
-    app.dependency_overrides[get_login_use_case] = lambda: MagicMock(spec=LoginUseCase)
-    app.dependency_overrides[get_password_recovery_use_case] = lambda: MagicMock(
-        spec=PasswordRecoveryUseCase
-    )
-    app.dependency_overrides[get_update_user_password_use_case] = lambda: MagicMock(
-        spec=UpdateUserPasswordUseCase
-    )
-    app.dependency_overrides[get_current_user] = lambda: TokenPayloadVO(
-        user_id=uuid4(),
-        role=RolesEnum.ADMIN,
-        expires_in=3600,
-        jti=uuid4(),
-    )
-    app.dependency_overrides[request_details_dependency] = lambda: {
-        "request_ip": "127.0.0.1",
-        "request_user_agent": "test-agent",
-    }
-
-    if reset_uc is not None:
-        app.dependency_overrides[get_reset_password_use_case] = lambda: reset_uc
-
-    app.dependency_overrides[get_logger] = lambda: MagicMock()
+    app.dependency_overrides[get_logger] = _logger
     return app
 
 
 class TestResetPasswordRoute:
     """Integration tests for PUT /api/auth/reset-password."""
 
-    @pytest.fixture
-    def reset_uc_mock(self):
-        return MagicMock(spec=ResetPasswordUseCase)
+    @pytest.fixture(scope="class")
+    def app(self, capture_use_case):
+        app = _make_app()
+        app.dependency_overrides[get_reset_password_use_case] = lambda: capture_use_case
+        return app
 
-    @pytest.fixture
-    def client(self, reset_uc_mock):
-        return TestClient(
-            _make_app(reset_uc=reset_uc_mock), raise_server_exceptions=False
-        )
+    @pytest.fixture(scope="class")
+    def client(self, app):
+        with TestClient(app, raise_server_exceptions=False) as client:
+            yield client
+
+    @pytest.fixture(autouse=True)
+    def _reset_stub_state(self, capture_use_case):
+        yield
+        capture_use_case.reset()
 
     # ──────────────────────── success path ──────────────────────────────
 
-    def test_returns_200_on_success(self, client, reset_uc_mock):
-        """Should return 200 when the password is reset successfully."""
-        reset_uc_mock.execute.return_value = None
+    def test_happy_path(self, client, capture_use_case):
+        """Should return 200 with a reset message and forward the body to the command."""
+        capture_use_case.return_value = None
 
-        response = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
+        response = client.put(_URL, content=RESET_PASSWORD_BYTES, headers=_JSON_HEADERS)
+        data = response.json()
 
         assert response.status_code == status.HTTP_200_OK
-
-    def test_success_response_contains_message(self, client, reset_uc_mock):
-        """Successful response must contain a 'message' field."""
-        reset_uc_mock.execute.return_value = None
-
-        data = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY).json()
-
         assert "message" in data
-
-    def test_success_message_mentions_password_reset(self, client, reset_uc_mock):
-        """Success message should confirm the password was reset."""
-        reset_uc_mock.execute.return_value = None
-
-        data = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY).json()
-
         assert (
             "password" in data["message"].lower() or "reset" in data["message"].lower()
         )
-
-    def test_use_case_execute_called_once(self, client, reset_uc_mock):
-        """Should call use case execute exactly once."""
-        reset_uc_mock.execute.return_value = None
-
-        client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
-
-        reset_uc_mock.execute.assert_called_once()
-
-    def test_command_contains_email_from_request(self, client, reset_uc_mock):
-        """The command passed to the use case must contain the email from the request."""
-        reset_uc_mock.execute.return_value = None
-
-        client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
-
-        command = reset_uc_mock.execute.call_args[0][0]
-        assert command.email == RESET_PASSWORD_BODY["email"]
-
-    def test_command_contains_recovery_code_from_request(self, client, reset_uc_mock):
-        """The command must contain the recovery_code from the request body."""
-        reset_uc_mock.execute.return_value = None
-
-        client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
-
-        command = reset_uc_mock.execute.call_args[0][0]
-        assert command.recovery_code == RESET_PASSWORD_BODY["recovery_code"]
-
-    def test_command_contains_new_password_from_request(self, client, reset_uc_mock):
-        """The command must contain the new_password from the request body."""
-        reset_uc_mock.execute.return_value = None
-
-        client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
-
-        command = reset_uc_mock.execute.call_args[0][0]
-        assert command.new_password == RESET_PASSWORD_BODY["new_password"]
-
-    # ──────────────────────── error paths ───────────────────────────────
-
-    def test_returns_404_when_user_not_found(self, client, reset_uc_mock):
-        """Should return 404 when UserNotFoundException is raised."""
-        reset_uc_mock.execute.side_effect = UserNotFoundException(
-            "email: user@example.com"
-        )
-
-        response = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
-
-        assert response.status_code == status.HTTP_404_NOT_FOUND
-
-    def test_404_response_message(self, client, reset_uc_mock):
-        """404 response message should state 'User not found'."""
-        reset_uc_mock.execute.side_effect = UserNotFoundException("email")
-
-        data = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY).json()
-
-        assert data["message"] == "User not found"
-
-    def test_returns_400_when_activation_code_expired(self, client, reset_uc_mock):
-        """Should return 400 when ActivationCodeExpiredException is raised."""
-        reset_uc_mock.execute.side_effect = ActivationCodeExpiredException()
-
-        response = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    def test_400_response_message_for_expired_code(self, client, reset_uc_mock):
-        """400 response message should indicate the activation code has expired."""
-        reset_uc_mock.execute.side_effect = ActivationCodeExpiredException()
-
-        data = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY).json()
-
-        assert (
-            "expired" in data["message"].lower()
-            or "activation" in data["message"].lower()
+        assert capture_use_case.calls == 1
+        command = capture_use_case.cmd
+        assert (command.email, command.recovery_code, command.new_password) == (
+            RESET_PASSWORD_BODY["email"],
+            RESET_PASSWORD_BODY["recovery_code"],
+            RESET_PASSWORD_BODY["new_password"],
         )
 
-    def test_returns_422_when_new_password_equals_current(self, client, reset_uc_mock):
-        """Should return 422 when NewPasswordEqualsCurrentException is raised."""
-        reset_uc_mock.execute.side_effect = NewPasswordEqualsCurrentException()
-
-        response = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
-
-        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
-
-    def test_422_response_message_for_same_password(self, client, reset_uc_mock):
-        """422 response message should state new and current passwords are the same."""
-        reset_uc_mock.execute.side_effect = NewPasswordEqualsCurrentException()
-
-        data = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY).json()
-
-        assert (
-            data["message"] == "The new password cannot be the same as the current one"
-        )
-
-    def test_returns_500_on_database_connection_error(self, client, reset_uc_mock):
-        """Should return 500 when DatabaseConnectionException is raised."""
-        reset_uc_mock.execute.side_effect = DatabaseConnectionException(
-            "Connection refused"
-        )
-
-        response = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
-
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
-
-    def test_returns_500_on_unexpected_database_error(self, client, reset_uc_mock):
-        """Should return 500 when UnexpectedDatabaseException is raised."""
-        reset_uc_mock.execute.side_effect = UnexpectedDatabaseException("Unknown")
-
-        response = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY)
+    # ──────────────────────── error paths ───────────────────────────────
 
-        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+    ERROR_CASES = [
+        (
+            lambda: UserNotFoundException("email: user@example.com"),
+            status.HTTP_404_NOT_FOUND,
+            lambda message: message == "User not found",
+        ),
+        (
+            lambda: ActivationCodeExpiredException(),
+            status.HTTP_400_BAD_REQUEST,
+            lambda message: "expired" in message.lower()
+            or "activation" in message.lower(),
+        ),
+        (
+            lambda: NewPasswordEqualsCurrentException(),
+            status.HTTP_422_UNPROCESSABLE_CONTENT,
+            lambda message: (
+                message == "The new password cannot be the same as the current one"
+            ),
+        ),
+        (
+            lambda: DatabaseConnectionException("Connection refused"),
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            None,
+        ),
+        (
+            lambda: UnexpectedDatabaseException("Unknown"),
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            None,
+        ),
+    ]
+
+    @pytest.mark.parametrize("exc,status_code,msg_check", ERROR_CASES)
+    def test_error_mapping(self, client, capture_use_case, exc, status_code, msg_check):
+        """Should map each use case exception to its status code and error body."""
+        capture_use_case.side_effect = exc()
+
+        response = client.put(_URL, content=RESET_PASSWORD_BYTES, headers=_JSON_HEADERS)
+
+        assert response.status_code == status_code
+        if msg_check is not None:
+            data = response.json()
+            assert msg_check(data["message"])
+            assert isinstance(data["details"], list)
+            assert len(data["details"]) > 0
 
     # ─────────────── request body validation (422) ───────────────────────
 
@@ -255,7 +213,7 @@ class TestResetPasswordRoute:
         """Should return 422 when the email field is missing."""
         body = {k: v for k, v in RESET_PASSWORD_BODY.items() if k != "email"}
 
-        response = client.put("/api/auth/reset-password", json=body)
+        response = client.put(_URL, json=body)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
@@ -263,7 +221,7 @@ class TestResetPasswordRoute:
         """Should return 422 when the recovery_code field is missing."""
         body = {k: v for k, v in RESET_PASSWORD_BODY.items() if k != "recovery_code"}
 
-        response = client.put("/api/auth/reset-password", json=body)
+        response = client.put(_URL, json=body)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
@@ -271,63 +229,29 @@ class TestResetPasswordRoute:
         """Should return 422 when the new_password field is missing."""
         body = {k: v for k, v in RESET_PASSWORD_BODY.items() if k != "new_password"}
 
-        response = client.put("/api/auth/reset-password", json=body)
+        response = client.put(_URL, json=body)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
     def test_returns_422_when_body_is_empty(self, client):
         """Should return 422 when the request body is empty."""
-        response = client.put("/api/auth/reset-password", json={})
+        response = client.put(_URL, json={})
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
     def test_returns_422_when_body_is_absent(self, client):
         """Should return 422 when no request body is provided at all."""
-        response = client.put("/api/auth/reset-password")
+        response = client.put(_URL)
 
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
 
-    # ─────────────────── error response structure ─────────────────────────
-
-    def test_error_response_has_message_and_details(self, client, reset_uc_mock):
-        """Error response must contain both 'message' and 'details' as a list."""
-        reset_uc_mock.execute.side_effect = UserNotFoundException("email")
-
-        data = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY).json()
-
-        assert "message" in data
-        assert "details" in data
-        assert isinstance(data["details"], list)
-
-    def test_error_details_is_non_empty_list(self, client, reset_uc_mock):
-        """Error details list must contain at least one item."""
-        reset_uc_mock.execute.side_effect = ActivationCodeExpiredException()
-
-        data = client.put("/api/auth/reset-password", json=RESET_PASSWORD_BODY).json()
-
-        assert len(data["details"]) > 0
-
     # ─────────────────── HTTP method restrictions ──────────────────────────
 
-    def test_get_method_is_not_allowed(self, client):
-        """GET on /api/auth/reset-password must return 405."""
-        assert (
-            client.get("/api/auth/reset-password").status_code
-            == status.HTTP_405_METHOD_NOT_ALLOWED
-        )
+    @pytest.mark.parametrize("method", ["get", "post", "delete"])
+    def test_method_not_allowed(self, client, method):
+        """Only PUT is routed on /api/auth/reset-password; other methods must return 405."""
+        kwargs = {"json": RESET_PASSWORD_BODY} if method == "post" else {}
 
-    def test_put_method_is_not_allowed(self, client):
-        """POST on /api/auth/reset-password must return 405."""
-        assert (
-            client.post(
-                "/api/auth/reset-password", json=RESET_PASSWORD_BODY
-            ).status_code
-            == status.HTTP_405_METHOD_NOT_ALLOWED
-        )
+        response = getattr(client, method)(_URL, **kwargs)
 
-    def test_delete_method_is_not_allowed(self, client):
-        """DELETE on /api/auth/reset-password must return 405."""
-        assert (
-            client.delete("/api/auth/reset-password").status_code
-            == status.HTTP_405_METHOD_NOT_ALLOWED
-        )
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
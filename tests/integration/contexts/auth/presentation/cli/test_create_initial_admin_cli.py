@@ -1,6 +1,7 @@
 """Integration tests for create_first_admin_cli (CLI presentation layer)."""
 
 import sys
+from types import MappingProxyType
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -9,13 +10,28 @@ from src.contexts.auth.domain.exceptions.exception import (
     AdminUserAlreadyExistsException,
     EmailAlreadyExistsException,
 )
-
-_CLI_MODULE = "src.contexts.auth.presentation.cli.create_first_admin_cli"
-
-
-def _patch_settings(**overrides):
-    """Return a MagicMock that behaves like the settings object."""
-    defaults = {
+from src.contexts.auth.presentation.cli import create_first_admin_cli as cli_mod
+
+# Mocks are built once at import and reset before every run instead of being
+# recreated (together with patch()'s own MagicMocks) for each test.
+_SETTINGS_MOCK = MagicMock()
+_USE_CASE_INSTANCE = MagicMock()
+_LOGGER_MOCK = MagicMock()
+_MOCK_PROTOTYPES = {
+    "SQLModelRepositoryAdapter": MagicMock(),
+    "PasswordHashServiceAdapter": MagicMock(),
+    "PasswordServiceAdapter": MagicMock(),
+    "SenderNotificationServiceAdapter": MagicMock(),
+    "TemplateRendererServiceAdapter": MagicMock(),
+    "StaffEmailPolicyServiceAdapter": MagicMock(),
+    "CreateAdminUseCase": MagicMock(return_value=_USE_CASE_INSTANCE),
+    "get_session": MagicMock(),
+    "get_logger": MagicMock(return_value=_LOGGER_MOCK),
+}
+
+
+_DEFAULTS = MappingProxyType(
+    {
         "LOG_LEVEL": "DEBUG",
         "SMTP_SERVER": "smtp.example.com",
         "SMTP_PORT": 587,
@@ -28,88 +44,81 @@ def _patch_settings(**overrides):
         "INITIAL_ADMIN_LAST_NAME": "Doe",
         "INITIAL_ADMIN_EMAIL": "john.doe@example.com",
     }
+)
+
+
+def _patch_settings(**overrides):
+    """Return the shared settings mock configured with defaults and *overrides*."""
+    _SETTINGS_MOCK.configure_mock(**(_DEFAULTS | overrides))
+    return _SETTINGS_MOCK
+
+
+def _reset_mocks():
+    """Clear recorded calls and side effects on every cached mock."""
+    for mock in _MOCK_PROTOTYPES.values():
+        mock.reset_mock()
+    _USE_CASE_INSTANCE.reset_mock(side_effect=True)
+    _LOGGER_MOCK.reset_mock()
+    _MOCK_PROTOTYPES["get_session"].return_value = iter([MagicMock()])
 
-    defaults.update(overrides)
-    mock = MagicMock()
-    for k, v in defaults.items():
-        setattr(mock, k, v)
-    return mock
+
+@pytest.fixture(scope="module")
+def cli_patch_stack():
+    """Swap the cached mocks into the CLI module once for the whole module.
+
+    The patches stay applied while the fixture is alive; ``_run`` and
+    ``_run_raising`` only reset and reconfigure the mocks they install.
+    """
+    with patch.multiple(
+        cli_mod,
+        settings=_patch_settings(),
+        logger=_LOGGER_MOCK,
+        **_MOCK_PROTOTYPES,
+    ) as patched:
+        yield patched
 
 
 def _run(**settings_overrides):
     """Execute create_initial_admin() with all infrastructure dependencies mocked.
 
-    Returns a dict with the mocks so callers can assert on them.
+    Requires the ``cli_patch_stack`` fixture. Returns a dict with the mocks so
+    callers can assert on them.
     """
-    import contextlib
-
-    import src.contexts.auth.presentation.cli.create_first_admin_cli as cli_mod
-
-    use_case_instance = MagicMock()
-    use_case_cls = MagicMock(return_value=use_case_instance)
-    logger_mock = MagicMock()
-
-    patches = [
-        patch(f"{_CLI_MODULE}.settings", _patch_settings(**settings_overrides)),
-        patch(f"{_CLI_MODULE}.SQLModelRepositoryAdapter"),
-        patch(f"{_CLI_MODULE}.PasswordHashServiceAdapter"),
-        patch(f"{_CLI_MODULE}.PasswordServiceAdapter"),
-        patch(f"{_CLI_MODULE}.SenderNotificationServiceAdapter"),
-        patch(f"{_CLI_MODULE}.TemplateRendererServiceAdapter"),
-        patch(f"{_CLI_MODULE}.StaffEmailPolicyServiceAdapter"),
-        patch(f"{_CLI_MODULE}.CreateAdminUseCase", use_case_cls),
-        patch(f"{_CLI_MODULE}.get_session", return_value=iter([MagicMock()])),
-        patch(f"{_CLI_MODULE}.get_logger", return_value=logger_mock),
-        patch(f"{_CLI_MODULE}.logger", logger_mock),
-    ]
-
-    with contextlib.ExitStack() as stack:
-        applied = [stack.enter_context(p) for p in patches]
-        cli_mod.create_initial_admin()
+    _reset_mocks()
+    _patch_settings(**settings_overrides)
+    cli_mod.create_initial_admin()
 
     return {
-        "use_case_instance": use_case_instance,
-        "use_case_cls": use_case_cls,
-        "logger": logger_mock,
-        "SenderNotificationServiceAdapter": applied[4],
-        "StaffEmailPolicyServiceAdapter": applied[6],
-        "SQLModelRepositoryAdapter": applied[1],
-        "PasswordHashServiceAdapter": applied[2],
-        "PasswordServiceAdapter": applied[3],
-        "TemplateRendererServiceAdapter": applied[5],
+        "use_case_instance": _USE_CASE_INSTANCE,
+        "use_case_cls": _MOCK_PROTOTYPES["CreateAdminUseCase"],
+        "logger": _LOGGER_MOCK,
+        "SenderNotificationServiceAdapter": _MOCK_PROTOTYPES[
+            "SenderNotificationServiceAdapter"
+        ],
+        "StaffEmailPolicyServiceAdapter": _MOCK_PROTOTYPES[
+            "StaffEmailPolicyServiceAdapter"
+        ],
+        "SQLModelRepositoryAdapter": _MOCK_PROTOTYPES["SQLModelRepositoryAdapter"],
+        "PasswordHashServiceAdapter": _MOCK_PROTOTYPES["PasswordHashServiceAdapter"],
+        "PasswordServiceAdapter": _MOCK_PROTOTYPES["PasswordServiceAdapter"],
+        "TemplateRendererServiceAdapter": _MOCK_PROTOTYPES[
+            "TemplateRendererServiceAdapter"
+        ],
     }
 
 
 def _run_raising(exc):
-    """Run create_initial_admin() configured so that execute() raises *exc*."""
-    import contextlib
-
-    import src.contexts.auth.presentation.cli.create_first_admin_cli as cli_mod
-
-    use_case_instance = MagicMock()
-    use_case_instance.execute.side_effect = exc
-    logger_mock = MagicMock()
-
-    patches = [
-        patch(f"{_CLI_MODULE}.settings", _patch_settings()),
-        patch(f"{_CLI_MODULE}.SQLModelRepositoryAdapter"),
-        patch(f"{_CLI_MODULE}.PasswordHashServiceAdapter"),
-        patch(f"{_CLI_MODULE}.PasswordServiceAdapter"),
-        patch(f"{_CLI_MODULE}.SenderNotificationServiceAdapter"),
-        patch(f"{_CLI_MODULE}.TemplateRendererServiceAdapter"),
-        patch(f"{_CLI_MODULE}.StaffEmailPolicyServiceAdapter"),
-        patch(f"{_CLI_MODULE}.CreateAdminUseCase", return_value=use_case_instance),
-        patch(f"{_CLI_MODULE}.get_session", return_value=iter([MagicMock()])),
-        patch(f"{_CLI_MODULE}.get_logger", return_value=logger_mock),
-        patch(f"{_CLI_MODULE}.logger", logger_mock),
-    ]
-
-    with contextlib.ExitStack() as stack:
-        for p in patches:
-            stack.enter_context(p)
-        cli_mod.create_initial_admin()
+    """Run create_initial_admin() with an injected use case whose execute() raises *exc*.
+
+    Requires the ``cli_patch_stack`` fixture for the settings and logger.
+    """
+    _reset_mocks()
+    _patch_settings()
+    _USE_CASE_INSTANCE.execute.side_effect = exc
+    cli_mod.create_initial_admin(_USE_CASE_INSTANCE)
 
 
+@pytest.mark.usefixtures("cli_patch_stack")
 class TestCreateInitialAdminSuccess:
     """Tests for the successful execution of create_initial_admin()."""
 
@@ -142,90 +151,95 @@ class TestCreateInitialAdminSuccess:
         assert command.email == "alice.wonder@example.com"
 
 
+@pytest.mark.usefixtures("cli_patch_stack")
 class TestCreateInitialAdminInfrastructureWiring:
     """Verify every infrastructure adapter is instantiated exactly once."""
 
-    def test_user_repository_is_instantiated(self):
-        """SQLModelRepositoryAdapter must be instantiated once."""
-        mocks = _run()
-        mocks["SQLModelRepositoryAdapter"].assert_called_once()
-
-    def test_password_hash_service_is_instantiated(self):
-        """PasswordHashServiceAdapter must be instantiated once."""
-        mocks = _run()
-        mocks["PasswordHashServiceAdapter"].assert_called_once()
-
-    def test_password_service_is_instantiated(self):
-        """PasswordServiceAdapter must be instantiated once."""
-        mocks = _run()
-        mocks["PasswordServiceAdapter"].assert_called_once()
-
-    def test_template_renderer_service_is_instantiated(self):
-        """TemplateRendererServiceAdapter must be instantiated once."""
-        mocks = _run()
-        mocks["TemplateRendererServiceAdapter"].assert_called_once()
-
-    def test_create_admin_use_case_is_instantiated_once(self):
-        """CreateAdminUseCase must be instantiated once."""
-        mocks = _run()
-        mocks["use_case_cls"].assert_called_once()
-
-    def test_sender_notification_service_receives_smtp_settings(self):
-        """SenderNotificationServiceAdapter must receive the SMTP config values."""
-        mocks = _run(
+    @pytest.fixture(scope="class")
+    def shared_mocks(self, cli_patch_stack):
+        """Run create_initial_admin() once with every wiring override applied."""
+        return _run(
             SMTP_SERVER="mail.corp.com",
             SMTP_PORT=465,
             USER_EMAIL="admin@corp.com",
             USER_PASSWORD="pwd123",
+            ALLOWED_STAFF_EMAIL_DOMAINS="corp.com",
+            ALLOWED_STAFF_ROLES="admin",
         )
-        mocks["SenderNotificationServiceAdapter"].assert_called_once_with(
+
+    @pytest.mark.parametrize(
+        "adapter_name",
+        [
+            "SQLModelRepositoryAdapter",
+            "PasswordHashServiceAdapter",
+            "PasswordServiceAdapter",
+            "TemplateRendererServiceAdapter",
+            "use_case_cls",
+        ],
+    )
+    def test_adapter_instantiated_once(self, adapter_name, shared_mocks):
+        """Each adapter and the use case must be instantiated once."""
+        shared_mocks[adapter_name].assert_called_once()
+
+    def test_sender_notification_service_receives_smtp_settings(self, shared_mocks):
+        """SenderNotificationServiceAdapter must receive the SMTP config values."""
+        shared_mocks["SenderNotificationServiceAdapter"].assert_called_once_with(
             "mail.corp.com",
             465,
             "admin@corp.com",
             "pwd123",
-            mocks["logger"],
+            shared_mocks["logger"],
         )
 
-    def test_staff_email_policy_service_receives_domain_and_role_settings(self):
+    def test_staff_email_policy_service_receives_domain_and_role_settings(
+        self, shared_mocks
+    ):
         """StaffEmailPolicyServiceAdapter must receive the allowed domain/role config."""
-        mocks = _run(
-            ALLOWED_STAFF_EMAIL_DOMAINS="corp.com",
-            ALLOWED_STAFF_ROLES="admin",
-        )
-        mocks["StaffEmailPolicyServiceAdapter"].assert_called_once_with(
+        shared_mocks["StaffEmailPolicyServiceAdapter"].assert_called_once_with(
             "corp.com", "admin"
         )
 
 
+@pytest.mark.usefixtures("cli_patch_stack")
 class TestCreateInitialAdminExceptionPropagation:
     """Verify that exceptions from the use-case propagate out of create_initial_admin()."""
 
-    def test_propagates_admin_already_exists_exception(self):
-        """AdminUserAlreadyExistsException must propagate unchanged."""
-        with pytest.raises(AdminUserAlreadyExistsException):
-            _run_raising(AdminUserAlreadyExistsException())
-
-    def test_propagates_email_already_exists_exception(self):
-        """EmailAlreadyExistsException must propagate unchanged."""
-        with pytest.raises(EmailAlreadyExistsException):
-            _run_raising(EmailAlreadyExistsException("john.doe@example.com"))
-
-    def test_propagates_generic_exception(self):
-        """Any unexpected RuntimeError must propagate unchanged."""
-        with pytest.raises(RuntimeError):
-            _run_raising(RuntimeError("DB unreachable"))
+    @pytest.mark.parametrize(
+        "exc, exc_type",
+        [
+            (AdminUserAlreadyExistsException(), AdminUserAlreadyExistsException),
+            (
+                EmailAlreadyExistsException("john.doe@example.com"),
+                EmailAlreadyExistsException,
+            ),
+            (RuntimeError("DB unreachable"), RuntimeError),
+        ],
+        ids=["admin_already_exists", "email_already_exists", "generic"],
+    )
+    def test_exception_propagates(self, exc, exc_type):
+        """Exceptions raised by the use case must propagate unchanged."""
+        with pytest.raises(exc_type):
+            _run_raising(exc)
 
 
 class TestCliEntrypointExitCodes:
     """Simulate the __main__ try/except block and verify exit codes and log calls."""
 
+    @pytest.fixture(scope="class")
+    def logger_mock(self):
+        """Provide one logger mock shared by the whole class."""
+        return MagicMock()
+
+    @pytest.fixture(autouse=True)
+    def _reset_logger_mock(self, logger_mock):
+        """Clear the calls recorded on the shared logger mock before each test."""
+        logger_mock.reset_mock()
+
     def _simulate_main(self, side_effect, logger_mock):
         """Reproduce the exact try/except/else structure from create_first_admin_cli and return the captured SystemExit."""
-        import src.contexts.auth.presentation.cli.create_first_admin_cli as cli_mod
-
         with (
-            patch(f"{_CLI_MODULE}.create_initial_admin", side_effect=side_effect),
-            patch(f"{_CLI_MODULE}.logger", logger_mock),
+            patch.object(cli_mod, "create_initial_admin", side_effect=side_effect),
+            patch.object(cli_mod, "logger", logger_mock),
         ):
             with pytest.raises(SystemExit) as exc_info:
                 try:
@@ -243,14 +257,13 @@ class TestCliEntrypointExitCodes:
                     sys.exit(0)
         return exc_info.value
 
-    def test_exits_0_on_success(self):
+    def test_exits_0_on_success(self, logger_mock):
         """Should exit 0 when create_initial_admin completes without errors."""
-        exc = self._simulate_main(side_effect=None, logger_mock=MagicMock())
+        exc = self._simulate_main(side_effect=None, logger_mock=logger_mock)
         assert exc.code == 0
 
-    def test_exits_0_when_admin_already_exists(self):
+    def test_exits_0_when_admin_already_exists(self, logger_mock):
         """Should exit 0 and skip when AdminUserAlreadyExistsException is raised."""
-        logger_mock = MagicMock()
         exc = self._simulate_main(
             side_effect=AdminUserAlreadyExistsException(), logger_mock=logger_mock
         )
@@ -259,9 +272,8 @@ class TestCliEntrypointExitCodes:
             "Admin user already exists. Skipping bootstrap."
         )
 
-    def test_exits_0_when_email_already_exists(self):
+    def test_exits_0_when_email_already_exists(self, logger_mock):
         """Should exit 0 and skip when EmailAlreadyExistsException is raised."""
-        logger_mock = MagicMock()
         exc = self._simulate_main(
             side_effect=EmailAlreadyExistsException("john@example.com"),
             logger_mock=logger_mock,
@@ -271,16 +283,15 @@ class TestCliEntrypointExitCodes:
             "Admin email already exists. Skipping bootstrap."
         )
 
-    def test_exits_1_on_unexpected_exception(self):
+    def test_exits_1_on_unexpected_exception(self, logger_mock):
         """Should exit 1 when an unexpected exception is raised."""
         exc = self._simulate_main(
-            side_effect=RuntimeError("Something went wrong"), logger_mock=MagicMock()
+            side_effect=RuntimeError("Something went wrong"), logger_mock=logger_mock
         )
         assert exc.code == 1
 
-    def test_logs_error_message_on_unexpected_exception(self):
+    def test_logs_error_message_on_unexpected_exception(self, logger_mock):
         """Should log the error detail when a generic exception is raised."""
-        logger_mock = MagicMock()
         self._simulate_main(
             side_effect=RuntimeError("DB unreachable"), logger_mock=logger_mock
         )
@@ -288,17 +299,15 @@ class TestCliEntrypointExitCodes:
             "Failed to create initial admin", error="DB unreachable"
         )
 
-    def test_does_not_log_error_when_admin_already_exists(self):
+    def test_does_not_log_error_when_admin_already_exists(self, logger_mock):
         """logger.error must NOT be called for AdminUserAlreadyExistsException."""
-        logger_mock = MagicMock()
         self._simulate_main(
             side_effect=AdminUserAlreadyExistsException(), logger_mock=logger_mock
         )
         logger_mock.error.assert_not_called()
 
-    def test_does_not_log_error_when_email_already_exists(self):
+    def test_does_not_log_error_when_email_already_exists(self, logger_mock):
         """logger.error must NOT be called for EmailAlreadyExistsException."""
-        logger_mock = MagicMock()
         self._simulate_main(
             side_effect=EmailAlreadyExistsException("admin@example.com"),
             logger_mock=logger_mock,
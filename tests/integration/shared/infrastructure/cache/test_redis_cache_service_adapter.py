@@ -1,7 +1,8 @@
 """Integration tests for RedisCacheServiceAdapter."""
 
 import json
-from unittest.mock import ANY, MagicMock
+from types import SimpleNamespace
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
 from redis import RedisError
@@ -10,10 +11,33 @@ from src.shared.domain.value_objects.cache_entry_vo import CacheEntryVO
 from src.shared.domain.value_objects.cache_key_vo import CacheKeyVO
 from src.shared.domain.value_objects.cache_ttl_vo import CacheTTLVO
 from src.shared.domain.value_objects.cache_value_vo import CacheValueVO
+from src.shared.infrastructure.cache import (
+    redis_cache_service_adapter as adapter_module,
+)
 from src.shared.infrastructure.cache.redis_cache_service_adapter import (
     RedisCacheServiceAdapter,
 )
-from src.shared.infrastructure.logging.logger import Logger
+
+_KEY_USER_123 = CacheKeyVO(key="cache:user:123")
+_KEY_TEST_1 = CacheKeyVO(key="cache:test:1")
+_TTL_3600 = CacheTTLVO(seconds=3600)
+_TTL_10 = CacheTTLVO(seconds=10)
+
+
+def _adapter_json(**overrides):
+    """Return a json stand-in for the adapter module with the given functions replaced.
+
+    Patching the adapter's ``json`` name, rather than ``json.loads`` itself, keeps
+    the stub from leaking into any other code that serializes during the test.
+    """
+    return SimpleNamespace(
+        **{
+            "loads": json.loads,
+            "dumps": json.dumps,
+            "JSONDecodeError": json.JSONDecodeError,
+        }
+        | overrides
+    )
 
 
 class MockCacheValueVO(CacheValueVO):
@@ -35,8 +59,23 @@ class MockCacheValueVO(CacheValueVO):
         pass
 
 
+class FakeLogger:
+    """Logger stand-in exposing only the methods the adapter calls."""
+
+    def __init__(self):
+        """Start with empty per-level call records."""
+        self.debug = Mock()
+        self.info = Mock()
+        self.error = Mock()
+
+    def reset_mock(self):
+        """Clear the calls recorded on every logging method."""
+        for method in (self.debug, self.info, self.error):
+            method.reset_mock()
+
+
 class TestsRedisCacheServiceAdapter:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def redis_client_mock(self):
         redis_mock = MagicMock()
         redis_mock.get_client = MagicMock(return_value=redis_mock)
@@ -45,11 +84,11 @@ class TestsRedisCacheServiceAdapter:
         redis_mock.delete = MagicMock()
         return redis_mock
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def logger_mock(self):
-        return MagicMock(spec=Logger)
+        return FakeLogger()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def redis_cache_service_adapter(self, redis_client_mock, logger_mock):
         return RedisCacheServiceAdapter(
             redis_client=redis_client_mock,
@@ -57,12 +96,22 @@ class TestsRedisCacheServiceAdapter:
             value_class=MockCacheValueVO,
         )
 
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, redis_client_mock, logger_mock):
+        for method in (
+            redis_client_mock.get,
+            redis_client_mock.setex,
+            redis_client_mock.delete,
+        ):
+            method.reset_mock(return_value=True, side_effect=True)
+        logger_mock.reset_mock()
+
     # ---------- GET ----------
 
     def test_get_cache_hit(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:user:123")
+        key = _KEY_USER_123
         redis_client_mock.get.return_value = '{"data": "cached_value"}'
 
         result = redis_cache_service_adapter.get(key)
@@ -73,7 +122,7 @@ class TestsRedisCacheServiceAdapter:
     def test_get_cache_miss(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:user:123")
+        key = _KEY_USER_123
         redis_client_mock.get.return_value = None
 
         result = redis_cache_service_adapter.get(key)
@@ -84,10 +133,23 @@ class TestsRedisCacheServiceAdapter:
     def test_get_json_decode_error(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:user:123")
+        key = _KEY_USER_123
         redis_client_mock.get.return_value = "not-json"
 
-        with pytest.raises(json.JSONDecodeError):
+        with (
+            patch.object(
+                adapter_module,
+                "json",
+                _adapter_json(
+                    loads=Mock(
+                        side_effect=json.JSONDecodeError(
+                            "Expecting value", "not-json", 0
+                        )
+                    )
+                ),
+            ),
+            pytest.raises(json.JSONDecodeError),
+        ):
             redis_cache_service_adapter.get(key)
 
         logger_mock.error.assert_called_with(
@@ -97,7 +159,7 @@ class TestsRedisCacheServiceAdapter:
     def test_get_redis_error(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:user:123")
+        key = _KEY_USER_123
         redis_client_mock.get.side_effect = RedisError("boom")
 
         with pytest.raises(RedisError):
@@ -110,7 +172,7 @@ class TestsRedisCacheServiceAdapter:
     def test_get_unexpected_error(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:user:123")
+        key = _KEY_USER_123
         redis_client_mock.get.side_effect = RuntimeError("weird")
 
         with pytest.raises(RuntimeError):
@@ -125,8 +187,8 @@ class TestsRedisCacheServiceAdapter:
     def test_set_cache_value(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:user:123")
-        ttl = CacheTTLVO(seconds=3600)
+        key = _KEY_USER_123
+        ttl = _TTL_3600
         value = MockCacheValueVO(data="new_value")
         entry = CacheEntryVO(key=key, ttl=ttl, value=value)
 
@@ -140,27 +202,30 @@ class TestsRedisCacheServiceAdapter:
         )
 
     def test_set_serialization_error(self, redis_cache_service_adapter, logger_mock):
-        key = CacheKeyVO(key="cache:test:1")
-        ttl = CacheTTLVO(seconds=10)
-
-        class BadValue(MockCacheValueVO):
-            def to_dict(self):
-                return {"data": object()}
-
-        entry = CacheEntryVO(key=key, ttl=ttl, value=BadValue("x"))
-
-        with pytest.raises(TypeError):
+        key = _KEY_TEST_1
+        ttl = _TTL_10
+
+        entry = CacheEntryVO(key=key, ttl=ttl, value=MockCacheValueVO("x"))
+
+        with (
+            patch.object(
+                adapter_module,
+                "json",
+                _adapter_json(dumps=Mock(side_effect=TypeError("not serializable"))),
+            ),
+            pytest.raises(TypeError),
+        ):
             redis_cache_service_adapter.set(entry)
 
         logger_mock.error.assert_called_with(
-            message="Value serialization failed", key=key.key, error=ANY
+            message="Value serialization failed", key=key.key, error="not serializable"
         )
 
     def test_set_redis_error(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:test:1")
-        ttl = CacheTTLVO(seconds=10)
+        key = _KEY_TEST_1
+        ttl = _TTL_10
         value = MockCacheValueVO("x")
         entry = CacheEntryVO(key=key, ttl=ttl, value=value)
 
@@ -178,7 +243,7 @@ class TestsRedisCacheServiceAdapter:
     def test_delete_cache_key(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:user:123")
+        key = _KEY_USER_123
 
         redis_cache_service_adapter.delete(key)
 
@@ -190,7 +255,7 @@ class TestsRedisCacheServiceAdapter:
     def test_delete_redis_error(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:test:1")
+        key = _KEY_TEST_1
         redis_client_mock.delete.side_effect = RedisError("down")
 
         with pytest.raises(RedisError):
@@ -203,7 +268,7 @@ class TestsRedisCacheServiceAdapter:
     def test_delete_unexpected_error(
         self, redis_cache_service_adapter, redis_client_mock, logger_mock
     ):
-        key = CacheKeyVO(key="cache:test:1")
+        key = _KEY_TEST_1
         redis_client_mock.delete.side_effect = RuntimeError("weird")
 
         with pytest.raises(RuntimeError):
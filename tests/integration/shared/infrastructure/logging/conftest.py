@@ -0,0 +1,108 @@
+import json
+from io import StringIO
+
+import pytest
+
+from src.shared.infrastructure.logging.logger import get_logger
+from src.shared.infrastructure.logging.logging_config import LoggingConfig
+
+
+def _configured_logger(level, stream):
+    """Return a Logger writing to *stream* with its level filter bound now.
+
+    Binding eagerly keeps the level in effect even after another test
+    reconfigures structlog.
+    """
+    logger = get_logger(level=level, stream=stream)
+    logger.logger = logger.logger.bind()
+    return logger
+
+
+def _configured_config_logger(level, stream):
+    """Configure logging at *level* into *stream* and return a bound logger.
+
+    Binding eagerly keeps the level in effect even after another test
+    reconfigures structlog.
+    """
+    return LoggingConfig.configure(
+        level=level, name="test_logger", stream=stream
+    ).bind()
+
+
+@pytest.fixture(scope="session")
+def log_stream():
+    """Provide the in-memory stream the session-scoped loggers write to."""
+    return StringIO()
+
+
+@pytest.fixture
+def json_sink(log_stream):
+    """Provide the log stream emptied before the test runs."""
+    log_stream.seek(0)
+    log_stream.truncate()
+    return log_stream
+
+
+@pytest.fixture(scope="session")
+def expect_log():
+    """Provide a checker that parses a JSON log line and asserts its fields."""
+
+    def _expect_log(output, **expected):
+        """Parse the JSON log line in *output* and assert it contains *expected*.
+
+        Returns:
+            dict: The parsed log line, for any further checks.
+        """
+        log_data = json.loads(output)
+        assert expected.items() <= log_data.items()
+        return log_data
+
+    return _expect_log
+
+
+@pytest.fixture(scope="session")
+def debug_logger(log_stream):
+    """Provide a DEBUG-level Logger configured once per session."""
+    return _configured_logger("DEBUG", log_stream)
+
+
+@pytest.fixture(scope="session")
+def info_logger(log_stream):
+    """Provide an INFO-level Logger configured once per session."""
+    return _configured_logger("INFO", log_stream)
+
+
+@pytest.fixture(scope="session")
+def warning_logger(log_stream):
+    """Provide a WARNING-level Logger configured once per session."""
+    return _configured_logger("WARNING", log_stream)
+
+
+@pytest.fixture(scope="session")
+def error_logger(log_stream):
+    """Provide an ERROR-level Logger configured once per session."""
+    return _configured_logger("ERROR", log_stream)
+
+
+@pytest.fixture(scope="session")
+def critical_logger(log_stream):
+    """Provide a CRITICAL-level Logger configured once per session."""
+    return _configured_logger("CRITICAL", log_stream)
+
+
+@pytest.fixture(scope="session")
+def info_config_logger(log_stream):
+    """Provide an INFO-level logger configured once per session."""
+    return _configured_config_logger("INFO", log_stream)
+
+
+@pytest.fixture(scope="session")
+def warning_config_logger(log_stream):
+    """Provide a WARNING-level logger configured once per session."""
+    return _configured_config_logger("WARNING", log_stream)
+
+
+@pytest.fixture(scope="session")
+def error_config_logger(log_stream):
+    """Provide an ERROR-level logger configured once per session."""
+    return _configured_config_logger("ERROR", log_stream)
@@ -1,7 +1,7 @@
 """Integration tests for Logger."""
 
-import inspect
 import json
+import sys
 
 from src.shared.infrastructure.logging.logger import (
     Logger,
@@ -21,70 +21,54 @@ class TestLogger:
         assert hasattr(logger, "info")
         assert hasattr(logger, "error")
 
-    def test_logger_debug_message(self, capsys):
+    def test_logger_debug_message(self, expect_log, json_sink, debug_logger):
         """Should log a debug message."""
-        logger = get_logger(level="DEBUG")
+        logger = debug_logger
         logger.debug("This is a debug message.")
-        captured = capsys.readouterr()
 
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
         if output:
-            log_data = json.loads(output)
-            assert log_data["event"] == "This is a debug message."
-            assert log_data["level"] == "debug"
+            expect_log(output, event="This is a debug message.", level="debug")
 
-    def test_logger_info_message(self, capsys):
+    def test_logger_info_message(self, expect_log, json_sink, info_logger):
         """Should log an info message."""
-        logger = get_logger(level="INFO")
+        logger = info_logger
         logger.info("This is an info message.")
-        captured = capsys.readouterr()
 
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
         if output:
-            log_data = json.loads(output)
-            assert log_data["event"] == "This is an info message."
-            assert log_data["level"] == "info"
+            expect_log(output, event="This is an info message.", level="info")
 
-    def test_logger_error_message(self, capsys):
+    def test_logger_error_message(self, expect_log, json_sink, error_logger):
         """Should log an error message."""
-        logger = get_logger(level="ERROR")
+        logger = error_logger
         logger.error("This is an error message.")
-        captured = capsys.readouterr()
 
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
         if output:
-            log_data = json.loads(output)
-            assert log_data["event"] == "This is an error message."
-            assert log_data["level"] == "error"
+            expect_log(output, event="This is an error message.", level="error")
 
-    def test_logger_critical_message(self, capsys):
+    def test_logger_critical_message(self, expect_log, json_sink, critical_logger):
         """Should log an critical message."""
-        logger = get_logger(level="CRITICAL")
+        logger = critical_logger
         logger.critical("Critical failure")
-        captured = capsys.readouterr()
 
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
         if output:
-            log_data = json.loads(output)
-            assert log_data["event"] == "Critical failure"
-            assert log_data["level"] == "critical"
+            expect_log(output, event="Critical failure", level="critical")
 
-    def test_logger_with_context(self, capsys):
+    def test_logger_with_context(self, expect_log, json_sink, info_logger):
         """Should log with additional context."""
-        logger = get_logger(level="INFO")
+        logger = info_logger
         logger.info("User action", user_id=123, action="login")
-        captured = capsys.readouterr()
 
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
         if output:
-            log_data = json.loads(output)
-            assert log_data["event"] == "User action"
-            assert log_data["user_id"] == 123
-            assert log_data["action"] == "login"
+            expect_log(output, event="User action", user_id=123, action="login")
 
-    def test_logger_level_filtering(self, capsys):
+    def test_logger_level_filtering(self, json_sink, warning_logger):
         """Should filter messages based on log level."""
-        logger = get_logger(level="WARNING")
+        logger = warning_logger
 
         logger.debug("Debug message")
         logger.info("Info message")
@@ -92,8 +76,7 @@ class TestLogger:
         logger.warning("Warning message")
         logger.error("Error message")
 
-        captured = capsys.readouterr()
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
 
         lines = [line for line in output.split("\n") if line.strip()]
 
@@ -124,10 +107,10 @@ class TestLogger:
         assert isinstance(logger2, Logger)
 
     def test_get_caller_module_name_fallback(self, monkeypatch):
-        def broken_stack():
-            raise IndexError
+        def broken_getframe(depth=0):
+            raise ValueError
 
-        monkeypatch.setattr(inspect, "stack", broken_stack)
+        monkeypatch.setattr(sys, "_getframe", broken_getframe)
 
         name = get_caller_module_name()
         assert name == "__main__"
@@ -1,7 +1,5 @@
 """Integration tests for LoggingConfig."""
 
-import json
-
 from src.shared.infrastructure.logging.logging_config import LoggingConfig
 
 
@@ -22,76 +20,62 @@ class TestLoggingConfig:
 
         assert "structlog" in str(type(logger))
 
-    def test_should_log_message_with_configured_logger(self, capsys):
+    def test_should_log_message_with_configured_logger(
+        self, expect_log, json_sink, info_config_logger
+    ):
         """Should log a message using the configured logger."""
-        level = "INFO"
-        name = "test_logger"
-        logger = LoggingConfig.configure(level=level, name=name)
+        logger = info_config_logger
 
         logger.info("This is a test log message.")
-        captured = capsys.readouterr()
 
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
         assert output
 
-        log_data = json.loads(output)
-        assert log_data["event"] == "This is a test log message."
-        assert log_data["level"] == "info"
+        expect_log(output, event="This is a test log message.", level="info")
 
-    def test_should_use_json_renderer(self, capsys):
+    def test_should_use_json_renderer(self, expect_log, json_sink, info_config_logger):
         """Should use JSON renderer for logging output."""
-        level = "INFO"
-        name = "test_logger"
-        logger = LoggingConfig.configure(level=level, name=name)
+        logger = info_config_logger
 
         logger.info("Test JSON renderer", key="value")
-        captured = capsys.readouterr()
-
-        output = captured.out.strip()
-        log_data = json.loads(output)
 
-        assert log_data["key"] == "value"
-        assert log_data["event"] == "Test JSON renderer"
-        assert log_data["level"] == "info"
+        output = json_sink.getvalue().strip()
+        log_data = expect_log(
+            output, key="value", event="Test JSON renderer", level="info"
+        )
         assert "timestamp" in log_data
 
-    def test_should_log_at_different_levels(self, capsys):
+    def test_should_log_at_different_levels(
+        self, expect_log, json_sink, warning_config_logger
+    ):
         """Should respect logging levels."""
-        level = "WARNING"
-        name = "test_logger"
-        logger = LoggingConfig.configure(level=level, name=name)
+        logger = warning_config_logger
 
         logger.debug("Debug message")
         logger.info("Info message")
 
         logger.warning("Warning message")
 
-        captured = capsys.readouterr()
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
 
         if output:
-            log_data = json.loads(output)
-            assert log_data["event"] == "Warning message"
-            assert log_data["level"] == "warning"
+            expect_log(output, event="Warning message", level="warning")
 
-    def test_should_include_exc_info_on_error(self, capsys):
+    def test_should_include_exc_info_on_error(
+        self, expect_log, json_sink, error_config_logger
+    ):
         """Should include exception info for error messages."""
-        level = "ERROR"
-        name = "test_logger"
-        logger = LoggingConfig.configure(level=level, name=name)
+        logger = error_config_logger
 
         try:
             raise ValueError("Test error")
         except ValueError:
             logger.error("An error occurred", exc_info=True)
 
-        captured = capsys.readouterr()
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
 
         if output:
-            log_data = json.loads(output)
-            assert log_data["event"] == "An error occurred"
-            assert log_data["level"] == "error"
+            log_data = expect_log(output, event="An error occurred", level="error")
             assert "exc_info" in log_data
 
     def test_should_configure_with_different_levels(self):
@@ -104,16 +88,14 @@ class TestLoggingConfig:
 
             assert hasattr(logger, "info")
 
-    def test_should_return_bound_logger_instance(self, capsys):
+    def test_should_return_bound_logger_instance(
+        self, expect_log, json_sink, info_config_logger
+    ):
         """Should return a logger that can actually log messages."""
-        level = "INFO"
-        name = "test_logger"
-        logger = LoggingConfig.configure(level=level, name=name)
+        logger = info_config_logger
 
         logger.info("Test message")
-        captured = capsys.readouterr()
-        output = captured.out.strip()
+        output = json_sink.getvalue().strip()
 
         assert output
-        log_data = json.loads(output)
-        assert log_data["event"] == "Test message"
+        expect_log(output, event="Test message")
@@ -0,0 +1,16 @@
+import pytest
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, select_autoescape
+
+
+@pytest.fixture(scope="session")
+def jinja_env(tmp_path_factory):
+    """Provide a Jinja2 environment with a bytecode cache shared by the session."""
+    return Environment(
+        loader=DictLoader(
+            {"test_template.html": "<h1>{{ title }}</h1><p>{{ content }}</p>"}
+        ),
+        autoescape=select_autoescape(["html"]),
+        bytecode_cache=FileSystemBytecodeCache(
+            directory=str(tmp_path_factory.mktemp("jbc"))
+        ),
+    )
@@ -10,9 +10,20 @@ from src.shared.infrastructure.notifications.sender_notification_service_adapter
     SenderNotificationServiceAdapter,
 )
 
+_LOGGER_PROTO = MagicMock(spec=Logger)
+
+_SMTP_SERVER = "smtp.example.com"
+_SMTP_PORT = 587
+
+NOTIFICATION = SendNotificationVO(
+    recipient="recipient@example.com",
+    subject="Test Subject",
+    body="<p>This is a test email.</p>",
+)
+
 
 class TestSendNotificationServiceAdapter:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def smtp_server_mock(self):
         smtp_mock = MagicMock()
         smtp_mock.sendmail = MagicMock()
@@ -21,35 +32,42 @@ class TestSendNotificationServiceAdapter:
         smtp_mock.quit = MagicMock()
         return smtp_mock
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
+    def smtp_factory_mock(self, smtp_server_mock):
+        return MagicMock(return_value=smtp_server_mock)
+
+    @pytest.fixture(scope="module")
     def logger_mock(self):
-        return MagicMock(spec=Logger)
+        return _LOGGER_PROTO
 
-    @pytest.fixture
-    def sender_notification_service_adapter(
-        self, smtp_server_mock, logger_mock, monkeypatch
-    ):
-        monkeypatch.setattr("smtplib.SMTP", lambda *args, **kwargs: smtp_server_mock)
+    @pytest.fixture(scope="module")
+    def sender_notification_service_adapter(self, smtp_factory_mock, logger_mock):
         return SenderNotificationServiceAdapter(
-            smtp_server="smtp.example.com",
-            smtp_port=587,
+            smtp_server=_SMTP_SERVER,
+            smtp_port=_SMTP_PORT,
             user_email="test@example.com",
             user_password="password",
             logger=logger_mock,
+            smtp_factory=smtp_factory_mock,
         )
 
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, smtp_factory_mock, smtp_server_mock, logger_mock):
+        smtp_factory_mock.reset_mock()
+        smtp_server_mock.reset_mock(side_effect=True)
+        logger_mock.reset_mock()
+
     def test_send_notification_success(
-        self, sender_notification_service_adapter, smtp_server_mock, logger_mock
+        self,
+        sender_notification_service_adapter,
+        smtp_factory_mock,
+        smtp_server_mock,
+        logger_mock,
     ):
         """Should send a notification successfully."""
-        notification = SendNotificationVO(
-            recipient="recipient@example.com",
-            subject="Test Subject",
-            body="<p>This is a test email.</p>",
-        )
-
-        sender_notification_service_adapter.send(notification)
+        sender_notification_service_adapter.send(NOTIFICATION)
 
+        smtp_factory_mock.assert_called_once_with(_SMTP_SERVER, _SMTP_PORT)
         smtp_server_mock.sendmail.assert_called_once()
         logger_mock.info.assert_called_once_with("Notification sent successfully.")
 
@@ -59,14 +77,8 @@ class TestSendNotificationServiceAdapter:
         """Should log an error when sending a notification fails."""
         smtp_server_mock.sendmail.side_effect = Exception("SMTP error")
 
-        notification = SendNotificationVO(
-            recipient="recipient@example.com",
-            subject="Test Subject",
-            body="<p>This is a test email.</p>",
-        )
-
         with pytest.raises(Exception, match="SMTP error"):
-            sender_notification_service_adapter.send(notification)
+            sender_notification_service_adapter.send(NOTIFICATION)
 
         logger_mock.error.assert_called_once_with(
             "Failed to send notification", error="SMTP error"
@@ -1,7 +1,5 @@
 """Integration tests for TemplateRendererServiceAdapter."""
 
-import os
-
 import pytest
 
 from src.shared.domain.value_objects.template_renderer_vo import (
@@ -31,26 +29,54 @@ class MockTemplateContextVO(BaseValueObject):
 
 
 class TestTemplateRendererServiceAdapter:
-    @pytest.fixture
-    def template_renderer(self):
-        templates_path = os.path.join(os.path.dirname(__file__), "templates")
-        os.makedirs(templates_path, exist_ok=True)
-        with open(os.path.join(templates_path, "test_template.html"), "w") as f:
-            f.write("<h1>{{ title }}</h1><p>{{ content }}</p>")
-
-        yield TemplateRendererServiceAdapter(templates_path, MockTemplateContextVO)
+    @pytest.fixture(scope="module")
+    def template_renderer(self, jinja_env):
+        return TemplateRendererServiceAdapter.from_environment(
+            jinja_env, MockTemplateContextVO
+        )
 
-        # Cleanup
-        os.remove(os.path.join(templates_path, "test_template.html"))
-        os.rmdir(templates_path)
+    @pytest.fixture(scope="module")
+    def templates_dir(self, tmp_path_factory):
+        directory = tmp_path_factory.mktemp("templates")
+        (directory / "test_template.html").write_text(
+            "<h1>{{ title }}</h1><p>{{ content }}</p>"
+        )
+        return directory
 
-    def test_render_template_successfully(self, template_renderer):
-        """Should render a template successfully with valid context."""
+    @pytest.fixture(scope="module")
+    def template_vo(self):
         template_name = TemplateNameVO("test_template.html")
         context = MockTemplateContextVO(data={"title": "Hello", "content": "World"})
-        template_vo = TemplateRendererVO(template_name=template_name, context=context)
+        return TemplateRendererVO(template_name=template_name, context=context)
+
+    def test_render_template_successfully(self, template_renderer, template_vo):
+        """Should render a template successfully with valid context."""
+        result = template_renderer.render(template_vo)
+
+        assert "<h1>Hello</h1>" in result
+        assert "<p>World</p>" in result
+
+    def test_render_template_from_templates_directory(self, templates_dir, template_vo):
+        """Should build its own environment from a templates directory path."""
+        template_renderer = TemplateRendererServiceAdapter(
+            str(templates_dir), MockTemplateContextVO
+        )
 
         result = template_renderer.render(template_vo)
 
         assert "<h1>Hello</h1>" in result
         assert "<p>World</p>" in result
+
+    def test_should_reject_both_templates_path_and_environment(
+        self, templates_dir, jinja_env
+    ):
+        """Should raise ValueError when a path and an environment are both given."""
+        with pytest.raises(ValueError):
+            TemplateRendererServiceAdapter(
+                str(templates_dir), MockTemplateContextVO, environment=jinja_env
+            )
+
+    def test_should_reject_missing_templates_path_and_environment(self):
+        """Should raise ValueError when neither a path nor an environment is given."""
+        with pytest.raises(ValueError):
+            TemplateRendererServiceAdapter(None, MockTemplateContextVO)
@@ -0,0 +1,97 @@
+import inspect
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import create_autospec
+
+import pytest
+
+from src.contexts.auth.domain.ports.repositories.doctor_repository_port import (
+    DoctorRepositoryPort,
+)
+from src.contexts.auth.domain.ports.repositories.patient_repository_port import (
+    PatientRepositoryPort,
+)
+from src.contexts.auth.domain.ports.repositories.user_repository_port import (
+    UserRepositoryPort,
+)
+from src.contexts.auth.domain.ports.services.activation_code_service_port import (
+    ActivationCodeServicePort,
+)
+from src.contexts.auth.domain.ports.services.authorization_policy_service_port import (
+    AuthorizationPolicyServicePort,
+)
+from src.contexts.auth.domain.ports.services.password_hash_service_port import (
+    PasswordHashServicePort,
+)
+from src.contexts.auth.domain.ports.services.password_service_port import (
+    PasswordServicePort,
+)
+from src.contexts.auth.domain.ports.services.staff_email_policy_service_port import (
+    StaffEmailPolicyServicePort,
+)
+from src.contexts.auth.domain.ports.services.token_service_port import TokenServicePort
+from src.shared.domain.ports.services.cache_service_port import CacheServicePort
+from src.shared.domain.ports.services.sender_notification_service_port import (
+    SenderNotificationServicePort,
+)
+from src.shared.domain.ports.services.template_renderer_service_port import (
+    TemplateRendererServicePort,
+)
+
+_PORT_SPECS = MappingProxyType(
+    {
+        "user_repository_port": UserRepositoryPort,
+        "cache_service_port": CacheServicePort,
+        "password_hash_service_port": PasswordHashServicePort,
+        "password_service_port": PasswordServicePort,
+        "token_service_port": TokenServicePort,
+        "activation_code_service_port": ActivationCodeServicePort,
+        "sender_notification_service_port": SenderNotificationServicePort,
+        "template_renderer_service_port": TemplateRendererServicePort,
+        "staff_email_policy_service_port": StaffEmailPolicyServicePort,
+        "authorization_policy_service_port": AuthorizationPolicyServicePort,
+        "patient_repository_port": PatientRepositoryPort,
+        "doctor_repository_port": DoctorRepositoryPort,
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def port_mocks():
+    """Provide one autospecced mock per use case port, shared across the module."""
+    return SimpleNamespace(
+        **{
+            name: create_autospec(spec, spec_set=True, instance=True)
+            for name, spec in _PORT_SPECS.items()
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def wire_use_case(port_mocks):
+    """Return a builder for use cases wired to the shared port mocks."""
+
+    def _make(use_case_cls, **overrides):
+        ports = {
+            name: getattr(port_mocks, name)
+            for name in inspect.signature(use_case_cls).parameters
+            if name in _PORT_SPECS
+        }
+        return use_case_cls(**(ports | overrides))
+
+    return _make
+
+
+@pytest.fixture
+def ports(port_mocks):
+    """Reset the shared port mocks and return them."""
+    for port in vars(port_mocks).values():
+        port.reset_mock(return_value=True, side_effect=True)
+    # Every scenario starts from a cache miss unless a test says otherwise.
+    port_mocks.cache_service_port.get.return_value = None
+    return port_mocks
+
+
+@pytest.fixture
+def use_case_factory(ports, wire_use_case):
+    """Reset the shared port mocks and return a builder for use cases wired to them."""
+    return wire_use_case
@@ -1,5 +1,6 @@
 """Unit tests for ActivateAccountUseCase."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -17,69 +18,54 @@ from src.contexts.auth.domain.value_objects.activation_code_cache_key_vo import
 )
 from src.contexts.auth.domain.value_objects.email_vo import EmailVO
 
+_EMAIL_VO = EmailVO("user@example.com")
+_ACTIVATION_KEY = ActivationCodeCacheKeyVO.from_user_id("user_id")
+
 
 class TestActivateAccountUseCase:
     """Unit tests for ActivateAccountUseCase."""
 
-    def setup_method(self):
-        """Setup mock dependencies for the use case."""
-        self.user_repository_port = Mock()
-        self.cache_service_port = Mock()
-
-        self.use_case = ActivateAccountUseCase(
-            user_repository_port=self.user_repository_port,
-            cache_service_port=self.cache_service_port,
-        )
+    @pytest.fixture(autouse=True)
+    def _wire_use_case(self, use_case_factory, port_mocks):
+        """Build the use case on the shared, freshly reset port mocks."""
+        self.use_case = use_case_factory(ActivateAccountUseCase)
+        self.user_repository_port = port_mocks.user_repository_port
+        self.cache_service_port = port_mocks.cache_service_port
 
     def test_activate_account_successfully(self):
         """Should activate account successfully with valid data."""
         activation_code = "valid_code"
         email = "user@example.com"
-        user = Mock()
-        user.id = "user_id"
+        user = SimpleNamespace(id="user_id")
         self.user_repository_port.find_by_email.return_value = user
         self.cache_service_port.get.return_value = Mock(code=activation_code)
 
         self.use_case.execute(activation_code, email)
 
-        self.user_repository_port.find_by_email.assert_called_once_with(EmailVO(email))
-        self.cache_service_port.get.assert_called_once_with(
-            ActivationCodeCacheKeyVO.from_user_id(user.id)
-        )
+        self.user_repository_port.find_by_email.assert_called_once_with(_EMAIL_VO)
+        self.cache_service_port.get.assert_called_once_with(_ACTIVATION_KEY)
         self.user_repository_port.status_update.assert_called_once_with(True, user.id)
-        self.cache_service_port.delete.assert_called_once_with(
-            ActivationCodeCacheKeyVO.from_user_id(user.id)
+        self.cache_service_port.delete.assert_called_once_with(_ACTIVATION_KEY)
+
+    @pytest.mark.parametrize(
+        "user_found, cached_code, activation_code, expected",
+        [
+            (False, "valid_code", "valid_code", UserNotFoundException),
+            (True, None, "valid_code", ActivationCodeExpiredException),
+            (True, "valid_code", "invalid_code", InvalidActivationCodeException),
+        ],
+        ids=["user_not_found", "code_expired", "invalid_code"],
+    )
+    def test_activate_account_failure(
+        self, user_found, cached_code, activation_code, expected
+    ):
+        """Should raise the matching exception for each failed activation scenario."""
+        self.user_repository_port.find_by_email.return_value = (
+            SimpleNamespace(id="user_id") if user_found else None
+        )
+        self.cache_service_port.get.return_value = (
+            None if cached_code is None else Mock(code=cached_code)
         )
 
-    def test_activate_account_user_not_found(self):
-        """Should raise UserNotFoundException if user is not found."""
-        activation_code = "valid_code"
-        email = "user@example.com"
-        self.user_repository_port.find_by_email.return_value = None
-
-        with pytest.raises(UserNotFoundException):
-            self.use_case.execute(activation_code, email)
-
-    def test_activate_account_code_expired(self):
-        """Should raise ActivationCodeExpiredException if code is expired."""
-        activation_code = "valid_code"
-        email = "user@example.com"
-        user = Mock()
-        user.id = "user_id"
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None
-
-        with pytest.raises(ActivationCodeExpiredException):
-            self.use_case.execute(activation_code, email)
-
-    def test_activate_account_invalid_code(self):
-        """Should raise InvalidActivationCodeException if code is invalid."""
-        activation_code = "invalid_code"
-        email = "user@example.com"
-        user = Mock()
-        user.id = "user_id"
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = Mock(code="valid_code")
-
-        with pytest.raises(InvalidActivationCodeException):
-            self.use_case.execute(activation_code, email)
+        with pytest.raises(expected):
+            self.use_case.execute(activation_code, "user@example.com")
@@ -20,22 +20,19 @@ from src.contexts.auth.domain.value_objects.email_vo import EmailVO
 class TestCreateAdminUseCase:
     """Unit tests for CreateAdminUseCase."""
 
-    def setup_method(self):
-        """Setup mock dependencies for the use case."""
-        self.user_repository_port = Mock()
-        self.password_hash_service_port = Mock()
-        self.password_service_port = Mock()
-        self.sender_notification_service_port = Mock()
-        self.template_renderer_service_port = Mock()
-        self.staff_email_policy_service_port = Mock()
-
-        self.use_case = CreateAdminUseCase(
-            user_repository_port=self.user_repository_port,
-            password_hash_service_port=self.password_hash_service_port,
-            password_service_port=self.password_service_port,
-            sender_notification_service_port=self.sender_notification_service_port,
-            template_renderer_service_port=self.template_renderer_service_port,
-            staff_email_policy_service_port=self.staff_email_policy_service_port,
+    @pytest.fixture(autouse=True)
+    def _wire_use_case(self, use_case_factory, port_mocks):
+        """Build the use case on the shared, freshly reset port mocks."""
+        self.use_case = use_case_factory(CreateAdminUseCase)
+        self.user_repository_port = port_mocks.user_repository_port
+        self.password_hash_service_port = port_mocks.password_hash_service_port
+        self.password_service_port = port_mocks.password_service_port
+        self.sender_notification_service_port = (
+            port_mocks.sender_notification_service_port
+        )
+        self.template_renderer_service_port = port_mocks.template_renderer_service_port
+        self.staff_email_policy_service_port = (
+            port_mocks.staff_email_policy_service_port
         )
 
     def test_create_admin_user_successfully(self):
@@ -63,41 +60,31 @@ class TestCreateAdminUseCase:
         self.user_repository_port.save.assert_called_once()
         self.sender_notification_service_port.send.assert_called_once()
 
-    def test_create_admin_user_already_exists(self):
-        """Should raise AdminUserAlreadyExistsException if admin user exists."""
+    @pytest.mark.parametrize(
+        "admin_exists, email_allowed, email_taken, expected",
+        [
+            (True, True, False, AdminUserAlreadyExistsException),
+            (False, False, False, InvalidCorporateEmailException),
+            (False, True, True, EmailAlreadyExistsException),
+        ],
+        ids=["admin_already_exists", "invalid_email", "email_already_exists"],
+    )
+    def test_create_admin_user_failure(
+        self, admin_exists, email_allowed, email_taken, expected
+    ):
+        """Should raise the matching exception for each failed creation scenario."""
         command = CreateAdminCommand(
             first_name="Admin",
             last_name="User",
             email="admin@example.com",
         )
-        self.user_repository_port.find_by_role.return_value = [Mock()]
-
-        with pytest.raises(AdminUserAlreadyExistsException):
-            self.use_case.execute(command)
-
-    def test_create_admin_user_invalid_email(self):
-        """Should raise InvalidCorporateEmailException for invalid email."""
-        command = CreateAdminCommand(
-            first_name="Admin",
-            last_name="User",
-            email="admin@example.com",
+        self.user_repository_port.find_by_role.return_value = (
+            [Mock()] if admin_exists else []
         )
-        self.user_repository_port.find_by_role.return_value = []
-        self.staff_email_policy_service_port.is_allowed.return_value = False
-
-        with pytest.raises(InvalidCorporateEmailException):
-            self.use_case.execute(command)
-
-    def test_create_admin_user_email_already_exists(self):
-        """Should raise EmailAlreadyExistsException if email already exists."""
-        command = CreateAdminCommand(
-            first_name="Admin",
-            last_name="User",
-            email="admin@example.com",
+        self.staff_email_policy_service_port.is_allowed.return_value = email_allowed
+        self.user_repository_port.find_by_email.return_value = (
+            Mock() if email_taken else None
         )
-        self.user_repository_port.find_by_role.return_value = []
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = Mock()
 
-        with pytest.raises(EmailAlreadyExistsException):
+        with pytest.raises(expected):
             self.use_case.execute(command)
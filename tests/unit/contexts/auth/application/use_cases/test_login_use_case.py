@@ -17,29 +17,21 @@ from src.contexts.auth.domain.exceptions.exception import (
 class TestLoginUseCase:
     """Unit tests for LoginUseCase."""
 
-    def setup_method(self):
-        """Setup mock dependencies for the use case."""
-        self.user_repository_port = Mock()
-        self.password_hash_service_port = Mock()
-        self.token_service_port = Mock()
-        self.cache_service_port = Mock()
-
-        self.use_case = LoginUseCase(
-            user_repository_port=self.user_repository_port,
-            password_hash_service_port=self.password_hash_service_port,
-            token_service_port=self.token_service_port,
-            cache_service_port=self.cache_service_port,
-            expire_in=3600,
-            attempts_limit=5,
-            waiting_time=300,
+    @pytest.fixture(autouse=True)
+    def _wire_use_case(self, use_case_factory, port_mocks):
+        """Build the use case on the shared, freshly reset port mocks."""
+        self.use_case = use_case_factory(
+            LoginUseCase, expire_in=3600, attempts_limit=5, waiting_time=300
         )
+        self.user_repository_port = port_mocks.user_repository_port
+        self.password_hash_service_port = port_mocks.password_hash_service_port
+        self.token_service_port = port_mocks.token_service_port
+        self.cache_service_port = port_mocks.cache_service_port
 
     def test_login_user_successfully(self):
         """Should login user successfully and return access token."""
         command = LoginCommand(email="user@example.com", password="PassSecure!23")
 
-        self.cache_service_port.get.return_value = None
-
         user = Mock()
         user.is_active = True
         user.password_hash = "hashed_password"
@@ -62,59 +54,33 @@ class TestLoginUseCase:
 
         self.cache_service_port.delete.assert_called_once()
 
-    def test_login_user_account_blocked(self):
-        """Should raise AccountTemporarilyBlockedException if account is blocked."""
-        command = LoginCommand(email="user@example.com", password="PassSecure!23")
-        self.cache_service_port.get.return_value = Mock(attempt=5)
-
-        with pytest.raises(AccountTemporarilyBlockedException):
-            self.use_case.execute(command)
-
-    def test_login_user_invalid_credentials(self):
-        """Should raise InvalidCredentialsException for invalid credentials."""
-        command = LoginCommand(email="user@example.com", password="wrongpassword")
-
-        self.cache_service_port.get.return_value = None
-
-        self.user_repository_port.find_by_email.return_value = None
-
-        with pytest.raises(InvalidCredentialsException):
-            self.use_case.execute(command)
-
-    def test_login_user_inactive_account(self):
-        """Should raise UserInactiveException if user account is inactive."""
-        command = LoginCommand(email="user@example.com", password="PassSecure!23")
-
-        self.cache_service_port.get.return_value = None
-
-        user = Mock()
-        user.is_active = False
-        self.user_repository_port.find_by_email.return_value = user
-
-        with pytest.raises(UserInactiveException):
-            self.use_case.execute(command)
-
-    def test_login_user_exceeds_attempts_limit(self):
-        """Should raise AccountTemporarilyBlockedException when login attempts exceed limit."""
-        command = LoginCommand(email="user@example.com", password="wrongpassword")
-
-        attempts_vo = Mock(attempt=5)
-        self.cache_service_port.get.return_value = attempts_vo
-
-        with pytest.raises(AccountTemporarilyBlockedException):
-            self.use_case.execute(command)
-
-    def test_login_user_invalid_password(self):
-        """Should raise InvalidCredentialsException for invalid password."""
+    @pytest.mark.parametrize(
+        "attempts, find_user, is_active, verify, expected",
+        [
+            (5, False, True, True, AccountTemporarilyBlockedException),
+            (None, False, True, True, InvalidCredentialsException),
+            (None, True, False, True, UserInactiveException),
+            (None, True, True, False, InvalidCredentialsException),
+        ],
+        ids=[
+            "account_blocked",
+            "invalid_credentials",
+            "inactive_account",
+            "invalid_password",
+        ],
+    )
+    def test_login_failure(self, attempts, find_user, is_active, verify, expected):
+        """Should raise the matching exception for each failed login scenario."""
         command = LoginCommand(email="user@example.com", password="Wrongpassword!23")
+        self.cache_service_port.get.return_value = (
+            None if attempts is None else Mock(attempt=attempts)
+        )
+        self.user_repository_port.find_by_email.return_value = (
+            Mock(is_active=is_active, password_hash="hashed_password")
+            if find_user
+            else None
+        )
+        self.password_hash_service_port.verify.return_value = verify
 
-        self.cache_service_port.get.return_value = None
-
-        user = Mock()
-        user.is_active = True
-        user.password_hash = "hashed_password"
-        self.user_repository_port.find_by_email.return_value = user
-        self.password_hash_service_port.verify.return_value = False
-
-        with pytest.raises(InvalidCredentialsException):
+        with pytest.raises(expected):
             self.use_case.execute(command)
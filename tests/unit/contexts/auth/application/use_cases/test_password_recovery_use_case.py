@@ -1,7 +1,8 @@
 """Unit tests for PasswordRecoveryUseCase."""
 
-from unittest.mock import MagicMock
-from uuid import uuid4
+from types import SimpleNamespace
+from unittest.mock import Mock
+from uuid import UUID
 
 import pytest
 
@@ -15,164 +16,106 @@ from src.contexts.auth.domain.value_objects.password_recovery_cache_key_vo impor
     PasswordRecoveryCacheKeyVO,
 )
 
+_USER_ID = UUID(int=1)
+_EMAIL_VO = EmailVO("user@example.com")
+_DEFAULT_COMMAND = PasswordRecoveryCommand(
+    email="user@example.com",
+    request_ip="127.0.0.1",
+    request_user_agent="Mozilla/5.0",
+)
+_RECOVERY_KEY = PasswordRecoveryCacheKeyVO.from_email(_EMAIL_VO)
+
 
 class TestPasswordRecoveryUseCase:
     """Unit tests for PasswordRecoveryUseCase."""
 
-    def setup_method(self):
-        """Set up mock dependencies before each test."""
-        self.user_repository_port = MagicMock()
-        self.activation_code_service_port = MagicMock()
-        self.cache_service_port = MagicMock()
-        self.template_renderer_service_port = MagicMock()
-        self.sender_notification_service_port = MagicMock()
-
-        self.use_case = PasswordRecoveryUseCase(
-            user_repository_port=self.user_repository_port,
-            activation_code_service_port=self.activation_code_service_port,
-            cache_service_port=self.cache_service_port,
-            template_renderer_service_port=self.template_renderer_service_port,
-            sender_notification_service_port=self.sender_notification_service_port,
+    @pytest.fixture(autouse=True)
+    def _wire_use_case(self, use_case_factory, port_mocks):
+        """Build the use case on the shared, freshly reset port mocks."""
+        self.use_case = use_case_factory(PasswordRecoveryUseCase)
+        self.user_repository_port = port_mocks.user_repository_port
+        self.activation_code_service_port = port_mocks.activation_code_service_port
+        self.cache_service_port = port_mocks.cache_service_port
+        self.template_renderer_service_port = port_mocks.template_renderer_service_port
+        self.sender_notification_service_port = (
+            port_mocks.sender_notification_service_port
         )
 
-    def _make_command(
-        self,
-        email: str = "user@example.com",
-        request_ip: str = "127.0.0.1",
-        request_user_agent: str = "Mozilla/5.0",
-    ) -> PasswordRecoveryCommand:
-        """Return a PasswordRecoveryCommand with sensible defaults."""
-        return PasswordRecoveryCommand(
-            email=email,
-            request_ip=request_ip,
-            request_user_agent=request_user_agent,
+    def _make_user(self, email: str = "user@example.com"):
+        """Return a lightweight stand-in for the user entity."""
+        return SimpleNamespace(
+            id=_USER_ID, email=EmailVO(email), first_name="John", last_name="Doe"
         )
 
-    def _make_user(self, email: str = "user@example.com"):
-        """Return a mock user entity."""
-        user = MagicMock()
-        user.id = uuid4()
-        user.email = EmailVO(email)
-        user.first_name = "John"
-        user.last_name = "Doe"
+    @pytest.fixture
+    def happy_path(self):
+        """Wire the ports for a successful recovery and return the found user."""
+        user = self._make_user()
+        self.user_repository_port.find_by_email.return_value = user
+        self.activation_code_service_port.generate.return_value = "ABC123"
+        self.template_renderer_service_port.render.return_value = "<html/>"
         return user
 
     # ──────────────────────── happy path ────────────────────────────────
 
-    def test_execute_succeeds_when_user_exists(self):
+    def test_execute_succeeds_when_user_exists(self, happy_path):
         """Should complete without raising when the user is found."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None
-        self.activation_code_service_port.generate.return_value = "ABC123"
-        self.template_renderer_service_port.render.return_value = "<html>body</html>"
+        self.use_case.execute(_DEFAULT_COMMAND)  # must not raise
 
-        self.use_case.execute(self._make_command())  # must not raise
-
-    def test_execute_looks_up_user_by_email(self):
+    def test_execute_looks_up_user_by_email(self, happy_path):
         """Should call find_by_email with the EmailVO from the command."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None
-        self.activation_code_service_port.generate.return_value = "ABC123"
-        self.template_renderer_service_port.render.return_value = "<html/>"
+        self.use_case.execute(_DEFAULT_COMMAND)
 
-        command = self._make_command(email="user@example.com")
-        self.use_case.execute(command)
-
-        self.user_repository_port.find_by_email.assert_called_once_with(
-            EmailVO("user@example.com")
-        )
+        self.user_repository_port.find_by_email.assert_called_once_with(_EMAIL_VO)
 
-    def test_execute_generates_recovery_code(self):
+    def test_execute_generates_recovery_code(self, happy_path):
         """Should call generate() on the activation code service."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None
-        self.activation_code_service_port.generate.return_value = "XY9876"
-        self.template_renderer_service_port.render.return_value = "<html/>"
-
-        self.use_case.execute(self._make_command())
+        self.use_case.execute(_DEFAULT_COMMAND)
 
         self.activation_code_service_port.generate.assert_called_once()
 
-    def test_execute_stores_recovery_code_in_cache(self):
+    def test_execute_stores_recovery_code_in_cache(self, happy_path):
         """Should call cache_service_port.set with a CacheEntryVO."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None
-        self.activation_code_service_port.generate.return_value = "ABC123"
-        self.template_renderer_service_port.render.return_value = "<html/>"
-
-        self.use_case.execute(self._make_command())
+        self.use_case.execute(_DEFAULT_COMMAND)
 
         self.cache_service_port.set.assert_called_once()
 
-    def test_execute_renders_email_template(self):
+    def test_execute_renders_email_template(self, happy_path):
         """Should call template_renderer_service_port.render once."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None
-        self.activation_code_service_port.generate.return_value = "ABC123"
-        self.template_renderer_service_port.render.return_value = "<html>content</html>"
-
-        self.use_case.execute(self._make_command())
+        self.use_case.execute(_DEFAULT_COMMAND)
 
         self.template_renderer_service_port.render.assert_called_once()
 
-    def test_execute_sends_notification_email(self):
+    def test_execute_sends_notification_email(self, happy_path):
         """Should call sender_notification_service_port.send once."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None
-        self.activation_code_service_port.generate.return_value = "ABC123"
-        self.template_renderer_service_port.render.return_value = "<html/>"
-
-        self.use_case.execute(self._make_command())
+        self.use_case.execute(_DEFAULT_COMMAND)
 
         self.sender_notification_service_port.send.assert_called_once()
 
-    def test_execute_sends_email_to_user_email_address(self):
+    def test_execute_sends_email_to_user_email_address(self, happy_path):
         """The notification recipient must match the user's email."""
-        user = self._make_user(email="user@example.com")
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None
-        self.activation_code_service_port.generate.return_value = "ABC123"
-        self.template_renderer_service_port.render.return_value = "<html/>"
-
-        self.use_case.execute(self._make_command(email="user@example.com"))
+        self.use_case.execute(_DEFAULT_COMMAND)
 
         send_call_args = self.sender_notification_service_port.send.call_args[0][0]
         assert send_call_args.recipient == "user@example.com"
 
     # ──────────────────── existing active code handling ─────────────────
 
-    def test_execute_deletes_existing_cache_entry_before_setting_new_one(self):
+    def test_execute_deletes_existing_cache_entry_before_setting_new_one(
+        self, happy_path
+    ):
         """If an active code exists in cache, it should be deleted first."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = MagicMock()  # active code exists
-        self.activation_code_service_port.generate.return_value = "NEW123"
-        self.template_renderer_service_port.render.return_value = "<html/>"
+        self.cache_service_port.get.return_value = Mock()  # active code exists
 
-        self.use_case.execute(self._make_command())
+        self.use_case.execute(_DEFAULT_COMMAND)
 
         # delete must be called before set
-        expected_key = PasswordRecoveryCacheKeyVO.from_email(
-            EmailVO("user@example.com")
-        )
-        self.cache_service_port.delete.assert_called_once_with(expected_key)
+        self.cache_service_port.delete.assert_called_once_with(_RECOVERY_KEY)
         self.cache_service_port.set.assert_called_once()
 
-    def test_execute_does_not_delete_cache_when_no_active_code(self):
+    def test_execute_does_not_delete_cache_when_no_active_code(self, happy_path):
         """Should NOT call cache delete when there is no existing active code."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None  # no active code
-        self.activation_code_service_port.generate.return_value = "ABC123"
-        self.template_renderer_service_port.render.return_value = "<html/>"
-
-        self.use_case.execute(self._make_command())
+        self.use_case.execute(_DEFAULT_COMMAND)
 
         self.cache_service_port.delete.assert_not_called()
 
@@ -183,14 +126,14 @@ class TestPasswordRecoveryUseCase:
         self.user_repository_port.find_by_email.return_value = None
 
         with pytest.raises(UserNotFoundException):
-            self.use_case.execute(self._make_command())
+            self.use_case.execute(_DEFAULT_COMMAND)
 
     def test_execute_does_not_generate_code_when_user_not_found(self):
         """Should not reach the code-generation step when user is missing."""
         self.user_repository_port.find_by_email.return_value = None
 
         with pytest.raises(UserNotFoundException):
-            self.use_case.execute(self._make_command())
+            self.use_case.execute(_DEFAULT_COMMAND)
 
         self.activation_code_service_port.generate.assert_not_called()
 
@@ -199,7 +142,7 @@ class TestPasswordRecoveryUseCase:
         self.user_repository_port.find_by_email.return_value = None
 
         with pytest.raises(UserNotFoundException):
-            self.use_case.execute(self._make_command())
+            self.use_case.execute(_DEFAULT_COMMAND)
 
         self.sender_notification_service_port.send.assert_not_called()
 
@@ -208,21 +151,15 @@ class TestPasswordRecoveryUseCase:
         self.user_repository_port.find_by_email.return_value = None
 
         with pytest.raises(UserNotFoundException):
-            self.use_case.execute(self._make_command())
+            self.use_case.execute(_DEFAULT_COMMAND)
 
         self.cache_service_port.set.assert_not_called()
 
     # ──────────────────────── email subject ─────────────────────────────
 
-    def test_execute_sends_email_with_reset_password_subject(self):
+    def test_execute_sends_email_with_reset_password_subject(self, happy_path):
         """The notification subject must be about password reset."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = None
-        self.activation_code_service_port.generate.return_value = "ABC123"
-        self.template_renderer_service_port.render.return_value = "<html/>"
-
-        self.use_case.execute(self._make_command())
+        self.use_case.execute(_DEFAULT_COMMAND)
 
         notification = self.sender_notification_service_port.send.call_args[0][0]
         assert (
@@ -1,5 +1,6 @@
 """Unit tests for RegisterUserUseCase."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -25,37 +26,40 @@ from src.contexts.auth.domain.exceptions.exception import (
 from src.contexts.auth.domain.value_objects.email_vo import EmailVO
 from src.shared.domain.exceptions.exception import MissingFieldException
 
+# Stand-in for "a matching record already exists" in repository lookups.
+_FOUND = object()
+
 
 class TestRegisterUserUseCase:
     """Unit tests for RegisterUserUseCase."""
 
-    def setup_method(self):
-        """Setup mock dependencies for the use case."""
-        self.user_repository_port = Mock()
-        self.patient_repository_port = Mock()
-        self.doctor_repository_port = Mock()
-        self.password_service_port = Mock()
-        self.password_hash_service_port = Mock()
-        self.activation_code_service_port = Mock()
-        self.cache_service_port = Mock()
-        self.staff_email_policy_service_port = Mock()
-        self.authorization_policy_service_port = Mock()
-        self.template_renderer_service_port = Mock()
-        self.sender_notification_service_port = Mock()
-
-        self.use_case = RegisterUserUseCase(
-            user_repository_port=self.user_repository_port,
-            patient_repository_port=self.patient_repository_port,
-            doctor_repository_port=self.doctor_repository_port,
-            password_service_port=self.password_service_port,
-            password_hash_service_port=self.password_hash_service_port,
-            activation_code_service_port=self.activation_code_service_port,
-            cache_service_port=self.cache_service_port,
-            staff_email_policy_service_port=self.staff_email_policy_service_port,
-            authorization_policy_service_port=self.authorization_policy_service_port,
-            template_renderer_service_port=self.template_renderer_service_port,
-            sender_notification_service_port=self.sender_notification_service_port,
+    @pytest.fixture(autouse=True)
+    def _wire_use_case(self, use_case_factory, port_mocks):
+        """Build the use case on the shared, freshly reset port mocks."""
+        self.use_case = use_case_factory(RegisterUserUseCase)
+        self.user_repository_port = port_mocks.user_repository_port
+        self.patient_repository_port = port_mocks.patient_repository_port
+        self.doctor_repository_port = port_mocks.doctor_repository_port
+        self.password_service_port = port_mocks.password_service_port
+        self.password_hash_service_port = port_mocks.password_hash_service_port
+        self.activation_code_service_port = port_mocks.activation_code_service_port
+        self.cache_service_port = port_mocks.cache_service_port
+        self.staff_email_policy_service_port = (
+            port_mocks.staff_email_policy_service_port
+        )
+        self.authorization_policy_service_port = (
+            port_mocks.authorization_policy_service_port
         )
+        self.sender_notification_service_port = (
+            port_mocks.sender_notification_service_port
+        )
+
+    @pytest.fixture
+    def happy_preamble(self):
+        """Authorize the registration and leave the email unregistered."""
+        self.authorization_policy_service_port.can_register.return_value = True
+        self.staff_email_policy_service_port.is_allowed.return_value = True
+        self.user_repository_port.find_by_email.return_value = None
 
     def test_register_user_unauthorized_role(self):
         """Should raise UnauthorizedUserRegistrationException for unauthorized role."""
@@ -90,7 +94,7 @@ class TestRegisterUserUseCase:
         with pytest.raises(InvalidCorporateEmailException):
             self.use_case.execute(command)
 
-    def test_register_user_email_already_exists(self):
+    def test_register_user_email_already_exists(self, happy_preamble):
         """Should raise EmailAlreadyExistsException if email is already registered."""
         command = RegisterUserCommand(
             first_name="John",
@@ -101,14 +105,12 @@ class TestRegisterUserUseCase:
             role_recorder="admin",
         )
 
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
         self.user_repository_port.find_by_email.return_value = Mock()
 
         with pytest.raises(EmailAlreadyExistsException):
             self.use_case.execute(command)
 
-    def test_register_user_patient_profile_creation(self):
+    def test_register_user_patient_profile_creation(self, happy_preamble):
         """Should create a patient profile successfully."""
         command = RegisterUserCommand(
             first_name="John",
@@ -123,23 +125,20 @@ class TestRegisterUserUseCase:
             role_recorder="admin",
         )
 
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = None
         self.patient_repository_port.find_by_user_id.return_value = None
         self.patient_repository_port.find_by_document.return_value = None
         self.patient_repository_port.find_by_phone.return_value = None
 
-        temp_password = Mock()
-        temp_password.value = "Temp_Password!23"
+        temp_password = SimpleNamespace(value="Temp_Password!23")
         self.password_service_port.generate.return_value = temp_password
         self.password_hash_service_port.hashed.return_value = "hashed_password"
 
-        saved_user = Mock()
-        saved_user.id = 1
-        saved_user.email = EmailVO("john.doe@example.com")
-        saved_user.first_name = "John"
-        saved_user.last_name = "Doe"
+        saved_user = SimpleNamespace(
+            id=1,
+            email=EmailVO("john.doe@example.com"),
+            first_name="John",
+            last_name="Doe",
+        )
         self.user_repository_port.save.return_value = saved_user
 
         self.activation_code_service_port.generate.return_value = "123456"
@@ -148,7 +147,7 @@ class TestRegisterUserUseCase:
 
         self.patient_repository_port.save.assert_called_once()
 
-    def test_register_user_doctor_profile_creation(self):
+    def test_register_user_doctor_profile_creation(self, happy_preamble):
         """Should create a doctor profile successfully."""
         command = RegisterUserCommand(
             first_name="Gregory",
@@ -166,23 +165,19 @@ class TestRegisterUserUseCase:
             role_recorder="doctor",
         )
 
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = None
-
         self.doctor_repository_port.find_by_user_id.return_value = None
         self.doctor_repository_port.find_by_license_number.return_value = None
 
-        temp_password = Mock()
-        temp_password.value = "Temp_Password!23"
+        temp_password = SimpleNamespace(value="Temp_Password!23")
         self.password_service_port.generate.return_value = temp_password
         self.password_hash_service_port.hashed.return_value = "hashed_password"
 
-        saved_user = Mock()
-        saved_user.id = 99
-        saved_user.email = EmailVO("house.md@example.com")
-        saved_user.first_name = "Gregory"
-        saved_user.last_name = "House"
+        saved_user = SimpleNamespace(
+            id=99,
+            email=EmailVO("house.md@example.com"),
+            first_name="Gregory",
+            last_name="House",
+        )
         self.user_repository_port.save.return_value = saved_user
 
         self.activation_code_service_port.generate.return_value = "654321"
@@ -193,7 +188,7 @@ class TestRegisterUserUseCase:
         self.cache_service_port.set.assert_called_once()
         self.sender_notification_service_port.send.assert_called_once()
 
-    def test_register_user_activation_code_and_email(self):
+    def test_register_user_activation_code_and_email(self, happy_preamble):
         """Should generate activation code and send email notification."""
         command = RegisterUserCommand(
             first_name="John",
@@ -204,20 +199,16 @@ class TestRegisterUserUseCase:
             role_recorder="admin",
         )
 
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = None
-
-        temp_password = Mock()
-        temp_password.value = "Temp_Password!23"
+        temp_password = SimpleNamespace(value="Temp_Password!23")
         self.password_service_port.generate.return_value = temp_password
         self.password_hash_service_port.hashed.return_value = "hashed_password"
 
-        saved_user = Mock()
-        saved_user.id = 1
-        saved_user.email = EmailVO("john.doe@example.com")
-        saved_user.first_name = "John"
-        saved_user.last_name = "Doe"
+        saved_user = SimpleNamespace(
+            id=1,
+            email=EmailVO("john.doe@example.com"),
+            first_name="John",
+            last_name="Doe",
+        )
         self.user_repository_port.save.return_value = saved_user
 
         self.activation_code_service_port.generate.return_value = "123456"
@@ -227,121 +218,79 @@ class TestRegisterUserUseCase:
         self.cache_service_port.set.assert_called_once()
         self.sender_notification_service_port.send.assert_called_once()
 
-    def test_register_user_patient_profile_already_exists(self):
-        """Should register user patient profile exists."""
-        command = RegisterUserCommand(
-            first_name="John",
-            last_name="Doe",
-            email="john@example.com",
-            role="patient",
-            profile=PatientProfileCommand("123", "555", "1990-01-01"),
-            role_recorder="patient",
+    @pytest.mark.parametrize(
+        "role, stubs, expected",
+        [
+            (
+                "patient",
+                [("patient_repository_port", "find_by_user_id", _FOUND)],
+                PatientProfileAlreadyExistsException,
+            ),
+            (
+                "patient",
+                [
+                    ("patient_repository_port", "find_by_user_id", None),
+                    ("patient_repository_port", "find_by_document", _FOUND),
+                ],
+                PatientDocumentAlreadyRegisteredException,
+            ),
+            (
+                "patient",
+                [
+                    ("patient_repository_port", "find_by_user_id", None),
+                    ("patient_repository_port", "find_by_document", None),
+                    ("patient_repository_port", "find_by_phone", _FOUND),
+                ],
+                PatientPhoneAlreadyRegisteredException,
+            ),
+            (
+                "doctor",
+                [("doctor_repository_port", "find_by_user_id", _FOUND)],
+                DoctorProfileAlreadyExistsException,
+            ),
+            (
+                "doctor",
+                [
+                    ("doctor_repository_port", "find_by_user_id", None),
+                    ("doctor_repository_port", "find_by_license_number", _FOUND),
+                ],
+                DoctorLicenseNumberAlreadyRegisteredException,
+            ),
+        ],
+        ids=[
+            "patient_profile_exists",
+            "patient_document_registered",
+            "patient_phone_registered",
+            "doctor_profile_exists",
+            "doctor_license_registered",
+        ],
+    )
+    def test_register_user_profile_already_registered(
+        self, role, stubs, expected, happy_preamble
+    ):
+        """Should raise the matching exception when profile data is already taken."""
+        profile = (
+            PatientProfileCommand("123", "555", "1990-01-01")
+            if role == "patient"
+            else DoctorProfileCommand("LIC1", 10, 1, "MD", "Bio")
         )
-
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = None
-
-        saved_user = Mock(id=1)
-        self.user_repository_port.save.return_value = saved_user
-        self.patient_repository_port.find_by_user_id.return_value = Mock()
-
-        with pytest.raises(PatientProfileAlreadyExistsException):
-            self.use_case.execute(command)
-
-    def test_register_user_patient_document_already_registered(self):
-        """Should register user patient document already registered."""
         command = RegisterUserCommand(
             first_name="John",
             last_name="Doe",
             email="john@example.com",
-            role="patient",
-            profile=PatientProfileCommand("123", "555", "1990-01-01"),
-            role_recorder="patient",
+            role=role,
+            profile=profile,
+            role_recorder=role,
         )
 
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = None
-
-        saved_user = Mock(id=1)
-        self.user_repository_port.save.return_value = saved_user
-        self.patient_repository_port.find_by_user_id.return_value = None
-        self.patient_repository_port.find_by_document.return_value = Mock()
+        self.user_repository_port.save.return_value = SimpleNamespace(id=1)
+        for port, method, value in stubs:
+            getattr(getattr(self, port), method).return_value = value
 
-        with pytest.raises(PatientDocumentAlreadyRegisteredException):
+        with pytest.raises(expected):
             self.use_case.execute(command)
 
-    def test_register_user_patient_phone_already_registered(self):
-        """Should register user patient phone already registered."""
-        command = RegisterUserCommand(
-            first_name="John",
-            last_name="Doe",
-            email="john@example.com",
-            role="patient",
-            profile=PatientProfileCommand("123", "555", "1990-01-01"),
-            role_recorder="patient",
-        )
-
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = None
-
-        saved_user = Mock(id=1)
-        self.user_repository_port.save.return_value = saved_user
-        self.patient_repository_port.find_by_user_id.return_value = None
-        self.patient_repository_port.find_by_document.return_value = None
-        self.patient_repository_port.find_by_phone.return_value = Mock()
-
-        with pytest.raises(PatientPhoneAlreadyRegisteredException):
-            self.use_case.execute(command)
-
-    def test_register_user_doctor_profile_already_exists(self):
-        """Should register user doctor profile already exists."""
-        command = RegisterUserCommand(
-            first_name="Greg",
-            last_name="House",
-            email="house@example.com",
-            role="doctor",
-            profile=DoctorProfileCommand("LIC1", 10, 1, "MD", "Bio"),
-            role_recorder="doctor",
-        )
-
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = None
-
-        saved_user = Mock(id=1)
-        self.user_repository_port.save.return_value = saved_user
-        self.doctor_repository_port.find_by_user_id.return_value = Mock()
-
-        with pytest.raises(DoctorProfileAlreadyExistsException):
-            self.use_case.execute(command)
-
-    def test_register_user_doctor_license_already_registered(self):
-        """Should register user doctor license already registered."""
-        command = RegisterUserCommand(
-            first_name="Greg",
-            last_name="House",
-            email="house@example.com",
-            role="doctor",
-            profile=DoctorProfileCommand("LIC1", 10, 1, "MD", "Bio"),
-            role_recorder="doctor",
-        )
-
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = None
-
-        saved_user = Mock(id=1)
-        self.user_repository_port.save.return_value = saved_user
-        self.doctor_repository_port.find_by_user_id.return_value = None
-        self.doctor_repository_port.find_by_license_number.return_value = Mock()
-
-        with pytest.raises(DoctorLicenseNumberAlreadyRegisteredException):
-            self.use_case.execute(command)
-
-    def test_register_user_doctor_profile_missing(self):
+    def test_register_user_doctor_profile_missing(self, happy_preamble):
         """Should register user doctor profile missing."""
         command = RegisterUserCommand(
             first_name="Greg",
@@ -352,10 +301,9 @@ class TestRegisterUserUseCase:
             role_recorder="doctor",
         )
 
-        self.authorization_policy_service_port.can_register.return_value = True
-        self.staff_email_policy_service_port.is_allowed.return_value = True
-        self.user_repository_port.find_by_email.return_value = None
-        self.password_service_port.generate.return_value = Mock(value="Temp123!")
+        self.password_service_port.generate.return_value = SimpleNamespace(
+            value="Temp123!"
+        )
         self.password_hash_service_port.hashed.return_value = "hashed"
 
         with pytest.raises(MissingFieldException):
@@ -1,6 +1,7 @@
 """Unit tests for ResetPasswordUseCase."""
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock
 from uuid import uuid4
 
 import pytest
@@ -19,25 +20,34 @@ from src.contexts.auth.domain.value_objects.password_recovery_cache_key_vo impor
     PasswordRecoveryCacheKeyVO,
 )
 
+_DEFAULT_EMAIL = EmailVO("user@example.com")
+_DEFAULT_RECOVERY_KEY = PasswordRecoveryCacheKeyVO.from_email(_DEFAULT_EMAIL)
+
+
+def _record_call(calls: list[str], name: str):
+    """Return a side effect that logs ``name`` and keeps the mock's return value."""
+
+    def _side_effect(*args, **kwargs):
+        calls.append(name)
+        return DEFAULT
+
+    return _side_effect
+
 
 class TestResetPasswordUseCase:
     """Unit tests for ResetPasswordUseCase."""
 
-    def setup_method(self):
-        """Set up mock dependencies before each test."""
-        self.user_repository_port = MagicMock()
-        self.password_hash_service_port = MagicMock()
-        self.cache_service_port = MagicMock()
-
-        self.use_case = ResetPasswordUseCase(
-            user_repository_port=self.user_repository_port,
-            password_hash_service_port=self.password_hash_service_port,
-            cache_service_port=self.cache_service_port,
-        )
+    @pytest.fixture(autouse=True)
+    def _wire_use_case(self, use_case_factory, port_mocks):
+        """Build the use case on the shared, freshly reset port mocks."""
+        self.use_case = use_case_factory(ResetPasswordUseCase)
+        self.user_repository_port = port_mocks.user_repository_port
+        self.password_hash_service_port = port_mocks.password_hash_service_port
+        self.cache_service_port = port_mocks.cache_service_port
 
     def _make_command(
         self,
-        email: str = "user@example.com",
+        email: str = _DEFAULT_EMAIL.email,
         recovery_code: str = "ABC123",
         new_password: str = "NewPass123!",
     ) -> ResetPasswordCommand:
@@ -48,19 +58,13 @@ class TestResetPasswordUseCase:
             new_password=new_password,
         )
 
-    def _make_user(self, email: str = "user@example.com"):
-        """Return a mock user entity."""
-        user = MagicMock()
-        user.id = uuid4()
-        user.email = EmailVO(email)
-        user.password_hash = MagicMock()
-        return user
+    def _make_user(self, email: EmailVO = _DEFAULT_EMAIL):
+        """Return a lightweight stand-in for the user entity."""
+        return SimpleNamespace(id=uuid4(), email=email, password_hash=object())
 
     def _make_cache_value(self, recovery_code: str = "ABC123"):
-        """Return a mock cache value with the given recovery code."""
-        cache_value = MagicMock()
-        cache_value.recovery_code = recovery_code
-        return cache_value
+        """Return a lightweight cache value with the given recovery code."""
+        return SimpleNamespace(recovery_code=recovery_code)
 
     # ──────────────────────── happy path ────────────────────────────────
 
@@ -70,7 +74,7 @@ class TestResetPasswordUseCase:
         self.user_repository_port.find_by_email.return_value = user
         self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
         self.password_hash_service_port.verify.return_value = False  # new != current
-        self.password_hash_service_port.hashed.return_value = MagicMock()
+        self.password_hash_service_port.hashed.return_value = Mock()
 
         self.use_case.execute(
             self._make_command(recovery_code="ABC123")
@@ -82,28 +86,23 @@ class TestResetPasswordUseCase:
         self.user_repository_port.find_by_email.return_value = user
         self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
         self.password_hash_service_port.verify.return_value = False
-        self.password_hash_service_port.hashed.return_value = MagicMock()
+        self.password_hash_service_port.hashed.return_value = Mock()
 
-        self.use_case.execute(self._make_command(email="user@example.com"))
+        self.use_case.execute(self._make_command())
 
-        self.user_repository_port.find_by_email.assert_called_once_with(
-            EmailVO("user@example.com")
-        )
+        self.user_repository_port.find_by_email.assert_called_once_with(_DEFAULT_EMAIL)
 
     def test_execute_checks_cache_with_correct_key(self):
         """Should call cache_service_port.get with the correct recovery cache key."""
-        user = self._make_user(email="user@example.com")
+        user = self._make_user()
         self.user_repository_port.find_by_email.return_value = user
         self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
         self.password_hash_service_port.verify.return_value = False
-        self.password_hash_service_port.hashed.return_value = MagicMock()
+        self.password_hash_service_port.hashed.return_value = Mock()
 
-        self.use_case.execute(self._make_command(email="user@example.com"))
+        self.use_case.execute(self._make_command())
 
-        expected_key = PasswordRecoveryCacheKeyVO.from_email(
-            EmailVO("user@example.com")
-        )
-        self.cache_service_port.get.assert_called_once_with(expected_key)
+        self.cache_service_port.get.assert_called_once_with(_DEFAULT_RECOVERY_KEY)
 
     def test_execute_hashes_new_password(self):
         """Should hash the new password before storing it."""
@@ -111,7 +110,7 @@ class TestResetPasswordUseCase:
         self.user_repository_port.find_by_email.return_value = user
         self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
         self.password_hash_service_port.verify.return_value = False
-        new_hash = MagicMock()
+        new_hash = Mock()
         self.password_hash_service_port.hashed.return_value = new_hash
 
         self.use_case.execute(self._make_command())
@@ -124,7 +123,7 @@ class TestResetPasswordUseCase:
         self.user_repository_port.find_by_email.return_value = user
         self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
         self.password_hash_service_port.verify.return_value = False
-        new_hash = MagicMock()
+        new_hash = Mock()
         self.password_hash_service_port.hashed.return_value = new_hash
 
         self.use_case.execute(self._make_command())
@@ -135,18 +134,15 @@ class TestResetPasswordUseCase:
 
     def test_execute_deletes_recovery_code_from_cache_after_reset(self):
         """Should delete the recovery cache entry after successfully updating the password."""
-        user = self._make_user(email="user@example.com")
+        user = self._make_user()
         self.user_repository_port.find_by_email.return_value = user
         self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
         self.password_hash_service_port.verify.return_value = False
-        self.password_hash_service_port.hashed.return_value = MagicMock()
+        self.password_hash_service_port.hashed.return_value = Mock()
 
-        self.use_case.execute(self._make_command(email="user@example.com"))
+        self.use_case.execute(self._make_command())
 
-        expected_key = PasswordRecoveryCacheKeyVO.from_email(
-            EmailVO("user@example.com")
-        )
-        self.cache_service_port.delete.assert_called_once_with(expected_key)
+        self.cache_service_port.delete.assert_called_once_with(_DEFAULT_RECOVERY_KEY)
 
     # ──────────────────────── user not found ────────────────────────────
 
@@ -157,31 +153,15 @@ class TestResetPasswordUseCase:
         with pytest.raises(UserNotFoundException):
             self.use_case.execute(self._make_command())
 
-    def test_does_not_check_cache_when_user_not_found(self):
-        """Should not access the cache when the user is missing."""
+    def test_user_not_found_early_exits(self):
+        """Should skip the cache and the password update when the user is missing."""
         self.user_repository_port.find_by_email.return_value = None
 
         with pytest.raises(UserNotFoundException):
             self.use_case.execute(self._make_command())
 
         self.cache_service_port.get.assert_not_called()
-
-    def test_does_not_update_password_when_user_not_found(self):
-        """Should not call update_password when user is missing."""
-        self.user_repository_port.find_by_email.return_value = None
-
-        with pytest.raises(UserNotFoundException):
-            self.use_case.execute(self._make_command())
-
         self.user_repository_port.update_password.assert_not_called()
-
-    def test_does_not_delete_cache_when_user_not_found(self):
-        """Should not delete the cache entry when user is missing."""
-        self.user_repository_port.find_by_email.return_value = None
-
-        with pytest.raises(UserNotFoundException):
-            self.use_case.execute(self._make_command())
-
         self.cache_service_port.delete.assert_not_called()
 
     # ──────────────────────── expired / missing recovery code ───────────
@@ -240,8 +220,8 @@ class TestResetPasswordUseCase:
         with pytest.raises(NewPasswordEqualsCurrentException):
             self.use_case.execute(self._make_command())
 
-    def test_does_not_update_password_when_new_equals_current(self):
-        """Should not call update_password when new password equals current."""
+    def test_new_password_equals_current_early_exits(self):
+        """Should not hash, store or clear anything when new password equals current."""
         user = self._make_user()
         self.user_repository_port.find_by_email.return_value = user
         self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
@@ -250,67 +230,40 @@ class TestResetPasswordUseCase:
         with pytest.raises(NewPasswordEqualsCurrentException):
             self.use_case.execute(self._make_command())
 
+        self.password_hash_service_port.hashed.assert_not_called()
         self.user_repository_port.update_password.assert_not_called()
-
-    def test_does_not_delete_cache_when_new_equals_current(self):
-        """Should not delete the cache entry when new password equals current."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
-        self.password_hash_service_port.verify.return_value = True
-
-        with pytest.raises(NewPasswordEqualsCurrentException):
-            self.use_case.execute(self._make_command())
-
         self.cache_service_port.delete.assert_not_called()
 
-    def test_does_not_hash_new_password_when_new_equals_current(self):
-        """Should not hash the new password when it equals the current one."""
-        user = self._make_user()
-        self.user_repository_port.find_by_email.return_value = user
-        self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
-        self.password_hash_service_port.verify.return_value = True
-
-        with pytest.raises(NewPasswordEqualsCurrentException):
-            self.use_case.execute(self._make_command())
-
-        self.password_hash_service_port.hashed.assert_not_called()
-
     # ──────────────────────── execution order ────────────────────────────
 
     def test_find_by_email_is_called_before_cache_get(self):
         """Should look up the user before checking the cache."""
-        call_order = []
-
-        def track_find(*args, **kwargs):
-            call_order.append("find_by_email")
-            return None
-
-        self.user_repository_port.find_by_email.side_effect = track_find
+        calls = []
+        self.user_repository_port.find_by_email.side_effect = _record_call(
+            calls, "find_by_email"
+        )
+        self.cache_service_port.get.side_effect = _record_call(calls, "cache_get")
+        self.user_repository_port.find_by_email.return_value = None
 
         with pytest.raises(UserNotFoundException):
             self.use_case.execute(self._make_command())
 
-        assert call_order == ["find_by_email"]
-        self.cache_service_port.get.assert_not_called()
+        assert calls == ["find_by_email"]
 
     def test_cache_delete_is_called_after_update_password(self):
         """The cache entry must be deleted after update_password is called."""
-        call_order = []
-
         user = self._make_user()
         self.user_repository_port.find_by_email.return_value = user
         self.cache_service_port.get.return_value = self._make_cache_value("ABC123")
         self.password_hash_service_port.verify.return_value = False
-        self.password_hash_service_port.hashed.return_value = MagicMock()
+        self.password_hash_service_port.hashed.return_value = Mock()
 
-        self.user_repository_port.update_password.side_effect = (
-            lambda *a, **kw: call_order.append("update_password")
-        )
-        self.cache_service_port.delete.side_effect = lambda *a, **kw: call_order.append(
-            "cache_delete"
+        calls = []
+        self.user_repository_port.update_password.side_effect = _record_call(
+            calls, "update_password"
         )
+        self.cache_service_port.delete.side_effect = _record_call(calls, "cache_delete")
 
         self.use_case.execute(self._make_command())
 
-        assert call_order == ["update_password", "cache_delete"]
+        assert calls == ["update_password", "cache_delete"]
@@ -1,7 +1,8 @@
 """Unit tests for UpdateUserPasswordUseCase."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock
-from uuid import uuid4
+from uuid import UUID
 
 import pytest
 
@@ -15,227 +16,169 @@ from src.contexts.auth.domain.exceptions.exception import (
     UserNotFoundException,
 )
 
+pytestmark = pytest.mark.usefixtures("ports")
 
-class TestUpdateUserPasswordUseCase:
-    """Unit tests for UpdateUserPasswordUseCase."""
+_USER_ID = UUID(int=1)
+_UNKNOWN_USER_ID = UUID(int=2)
 
-    def setup_method(self):
-        """Setup mock dependencies for the use case."""
-        self.user_repository_port = Mock()
-        self.password_service_port = Mock()
-        self.password_hash_service_port = Mock()
 
-        self.use_case = UpdateUserPasswordUseCase(
-            user_repository_port=self.user_repository_port,
-            password_service_port=self.password_service_port,
-            password_hash_service_port=self.password_hash_service_port,
-        )
-
-    def _make_command(
-        self,
-        user_id=None,
-        current_password="OldPassword123!",
-        new_password="NewPassword456!",
-    ) -> UpdateUserPasswordCommand:
-        """Helper to build an UpdateUserPasswordCommand."""
-        return UpdateUserPasswordCommand(
-            user_id=user_id or uuid4(),
-            current_password=current_password,
-            new_password=new_password,
-        )
-
-    # ──────────────────────────── happy path ────────────────────────────
-
-    def test_update_password_successfully(self):
-        """Should update password successfully with valid credentials."""
-        user = Mock()
-        user.id = uuid4()
-        user.password_hash = Mock()
-
-        self.user_repository_port.find_by_id.return_value = user
-        # current password matches
-        self.password_hash_service_port.verify.side_effect = [True, False]
-        new_hash = Mock()
-        self.password_hash_service_port.hashed.return_value = new_hash
-
-        command = self._make_command(user_id=user.id)
-        self.use_case.execute(command)
-
-        self.user_repository_port.find_by_id.assert_called_once_with(command.user_id)
-        self.user_repository_port.update_password.assert_called_once_with(
-            user.id, new_hash
-        )
-
-    def test_update_password_calls_verify_twice(self):
-        """Should call verify twice: once for current password, once to detect equality."""
-        user = Mock()
-        user.id = uuid4()
-        user.password_hash = Mock()
-
-        self.user_repository_port.find_by_id.return_value = user
-        self.password_hash_service_port.verify.side_effect = [True, False]
-        self.password_hash_service_port.hashed.return_value = Mock()
-
-        command = self._make_command(user_id=user.id)
-        self.use_case.execute(command)
+@pytest.fixture(scope="module")
+def use_case(wire_use_case):
+    """Wire the use case once per module on the shared port mocks."""
+    return wire_use_case(UpdateUserPasswordUseCase)
 
-        assert self.password_hash_service_port.verify.call_count == 2
 
-    def test_update_password_hashes_new_password(self):
-        """Should hash the new password before storing it."""
-        user = Mock()
-        user.id = uuid4()
-        user.password_hash = Mock()
+@pytest.fixture
+def user(ports):
+    """Return a user stand-in that the repository finds by id."""
+    user = SimpleNamespace(id=_USER_ID, password_hash=object())
+    ports.user_repository_port.find_by_id.return_value = user
+    return user
 
-        self.user_repository_port.find_by_id.return_value = user
-        self.password_hash_service_port.verify.side_effect = [True, False]
-        new_hash = Mock()
-        self.password_hash_service_port.hashed.return_value = new_hash
 
-        command = self._make_command(user_id=user.id)
-        self.use_case.execute(command)
+@pytest.fixture
+def happy_verify(ports):
+    """Make verify accept the current password and reject new == current."""
+    ports.password_hash_service_port.verify.side_effect = [True, False]
 
-        self.password_hash_service_port.hashed.assert_called_once()
 
-    # ──────────────────────────── user not found ────────────────────────
-
-    def test_raises_user_not_found_when_user_does_not_exist(self):
-        """Should raise UserNotFoundException when user is not found by ID."""
-        self.user_repository_port.find_by_id.return_value = None
-
-        command = self._make_command()
-
-        with pytest.raises(UserNotFoundException):
-            self.use_case.execute(command)
-
-    def test_does_not_verify_password_when_user_not_found(self):
-        """Should not verify password when user does not exist."""
-        self.user_repository_port.find_by_id.return_value = None
-
-        command = self._make_command()
-
-        with pytest.raises(UserNotFoundException):
-            self.use_case.execute(command)
-
-        self.password_hash_service_port.verify.assert_not_called()
+@pytest.fixture
+def command(user):
+    """Return an update command for the stand-in user."""
+    return UpdateUserPasswordCommand(
+        user_id=user.id,
+        current_password="OldPassword123!",
+        new_password="NewPassword456!",
+    )
 
-    def test_user_not_found_exception_uses_id_field(self):
-        """UserNotFoundException should be raised with 'id' as field."""
-        self.user_repository_port.find_by_id.return_value = None
 
-        command = self._make_command()
+# ──────────────────────────── happy path ────────────────────────────
 
-        with pytest.raises(UserNotFoundException) as exc_info:
-            self.use_case.execute(command)
 
-        assert exc_info.value.field == "id"
+def test_update_password_successfully(use_case, ports, user, command, happy_verify):
+    """Should update password successfully with valid credentials."""
+    new_hash = Mock()
+    ports.password_hash_service_port.hashed.return_value = new_hash
 
-    # ──────────────────────────── wrong current password ────────────────
+    use_case.execute(command)
 
-    def test_raises_current_password_incorrect_when_password_does_not_match(self):
-        """Should raise CurrentPasswordIncorrectException when current password is wrong."""
-        user = Mock()
-        user.id = uuid4()
-        user.password_hash = Mock()
+    ports.user_repository_port.find_by_id.assert_called_once_with(command.user_id)
+    ports.user_repository_port.update_password.assert_called_once_with(
+        user.id, new_hash
+    )
 
-        self.user_repository_port.find_by_id.return_value = user
-        self.password_hash_service_port.verify.return_value = False
 
-        command = self._make_command(user_id=user.id)
+def test_update_password_calls_verify_twice(use_case, ports, command, happy_verify):
+    """Should call verify twice: once for current password, once to detect equality."""
+    ports.password_hash_service_port.hashed.return_value = Mock()
 
-        with pytest.raises(CurrentPasswordIncorrectException):
-            self.use_case.execute(command)
+    use_case.execute(command)
 
-    def test_does_not_update_password_when_current_is_incorrect(self):
-        """Should not call update_password when current password is wrong."""
-        user = Mock()
-        user.id = uuid4()
-        user.password_hash = Mock()
+    assert ports.password_hash_service_port.verify.call_count == 2
 
-        self.user_repository_port.find_by_id.return_value = user
-        self.password_hash_service_port.verify.return_value = False
 
-        command = self._make_command(user_id=user.id)
+def test_update_password_hashes_new_password(use_case, ports, command, happy_verify):
+    """Should hash the new password before storing it."""
+    new_hash = Mock()
+    ports.password_hash_service_port.hashed.return_value = new_hash
 
-        with pytest.raises(CurrentPasswordIncorrectException):
-            self.use_case.execute(command)
+    use_case.execute(command)
 
-        self.user_repository_port.update_password.assert_not_called()
+    ports.password_hash_service_port.hashed.assert_called_once()
 
-    # ──────────────────────────── same password ─────────────────────────
 
-    def test_raises_new_password_equals_current_when_passwords_are_identical(self):
-        """Should raise NewPasswordEqualsCurrentException when new == current."""
-        user = Mock()
-        user.id = uuid4()
-        user.password_hash = Mock()
+# ──────────────────────────── user not found ────────────────────────
 
-        self.user_repository_port.find_by_id.return_value = user
-        # Both calls to verify return True → current matches AND new equals current
-        self.password_hash_service_port.verify.return_value = True
 
-        command = self._make_command(user_id=user.id)
+@pytest.fixture
+def executed_user_not_found(use_case, ports):
+    """Run execute for an unknown user id and return the raised exception info."""
+    ports.user_repository_port.find_by_id.return_value = None
 
-        with pytest.raises(NewPasswordEqualsCurrentException):
-            self.use_case.execute(command)
+    with pytest.raises(UserNotFoundException) as exc_info:
+        use_case.execute(
+            UpdateUserPasswordCommand(
+                user_id=_UNKNOWN_USER_ID,
+                current_password="OldPassword123!",
+                new_password="NewPassword456!",
+            )
+        )
+    return exc_info
 
-    def test_does_not_update_password_when_new_equals_current(self):
-        """Should not call update_password when new password equals current."""
-        user = Mock()
-        user.id = uuid4()
-        user.password_hash = Mock()
 
-        self.user_repository_port.find_by_id.return_value = user
-        self.password_hash_service_port.verify.return_value = True
+@pytest.mark.parametrize(
+    "port, method",
+    [
+        ("password_hash_service_port", "verify"),
+        ("user_repository_port", "update_password"),
+    ],
+    ids=["verify", "update_password"],
+)
+def test_user_not_found_skips(ports, executed_user_not_found, port, method):
+    """Should stop before verifying or storing anything when the user is missing."""
+    getattr(getattr(ports, port), method).assert_not_called()
 
-        command = self._make_command(user_id=user.id)
 
-        with pytest.raises(NewPasswordEqualsCurrentException):
-            self.use_case.execute(command)
+def test_user_not_found_looks_up_user_first(ports, executed_user_not_found):
+    """Should look up the user once, before any password verification."""
+    ports.user_repository_port.find_by_id.assert_called_once()
 
-        self.user_repository_port.update_password.assert_not_called()
 
-    def test_does_not_hash_new_password_when_new_equals_current(self):
-        """Should not hash new password when it equals the current password."""
-        user = Mock()
-        user.id = uuid4()
-        user.password_hash = Mock()
+def test_user_not_found_exception_uses_id_field(executed_user_not_found):
+    """UserNotFoundException should be raised with 'id' as field."""
+    assert executed_user_not_found.value.field == "id"
 
-        self.user_repository_port.find_by_id.return_value = user
-        self.password_hash_service_port.verify.return_value = True
 
-        command = self._make_command(user_id=user.id)
+# ──────────────────────────── wrong current password ────────────────
 
-        with pytest.raises(NewPasswordEqualsCurrentException):
-            self.use_case.execute(command)
 
-        self.password_hash_service_port.hashed.assert_not_called()
+@pytest.fixture
+def executed_current_incorrect(use_case, ports, command):
+    """Run execute with a wrong current password and return the raised exception info."""
+    ports.password_hash_service_port.verify.return_value = False
 
-    # ──────────────────────── execution order ────────────────────────────
+    with pytest.raises(CurrentPasswordIncorrectException) as exc_info:
+        use_case.execute(command)
+    return exc_info
 
-    def test_find_by_id_called_before_verify(self):
-        """Should look up the user before any password verification."""
-        call_order = []
 
-        def track_find(*args, **kwargs):
-            call_order.append("find_by_id")
-            return None
+@pytest.mark.parametrize(
+    "port, method",
+    [
+        ("password_hash_service_port", "hashed"),
+        ("user_repository_port", "update_password"),
+    ],
+    ids=["hashed", "update_password"],
+)
+def test_current_password_incorrect_skips(
+    ports, executed_current_incorrect, port, method
+):
+    """Should raise and store nothing when the current password is wrong."""
+    getattr(getattr(ports, port), method).assert_not_called()
 
-        self.user_repository_port.find_by_id.side_effect = track_find
 
-        command = self._make_command()
+# ──────────────────────────── same password ─────────────────────────
 
-        with pytest.raises(UserNotFoundException):
-            self.use_case.execute(command)
 
-        assert call_order == ["find_by_id"]
-        self.password_hash_service_port.verify.assert_not_called()
+@pytest.fixture
+def executed_same_password(use_case, ports, command):
+    """Run execute with new == current password and return the raised exception info."""
+    # Both calls to verify return True → current matches AND new equals current
+    ports.password_hash_service_port.verify.return_value = True
 
-    def test_password_not_updated_when_user_not_found(self):
-        """Repository update_password must not be called when user is missing."""
-        self.user_repository_port.find_by_id.return_value = None
+    with pytest.raises(NewPasswordEqualsCurrentException) as exc_info:
+        use_case.execute(command)
+    return exc_info
 
-        with pytest.raises(UserNotFoundException):
-            self.use_case.execute(self._make_command())
 
-        self.user_repository_port.update_password.assert_not_called()
+@pytest.mark.parametrize(
+    "port, method",
+    [
+        ("password_hash_service_port", "hashed"),
+        ("user_repository_port", "update_password"),
+    ],
+    ids=["hashed", "update_password"],
+)
+def test_new_password_equals_current_skips(ports, executed_same_password, port, method):
+    """Should raise and store nothing when the new password equals the current one."""
+    getattr(getattr(ports, port), method).assert_not_called()
@@ -0,0 +1,112 @@
+from datetime import date
+from types import MappingProxyType
+from uuid import UUID
+
+import pytest
+
+from src.contexts.auth.domain.entities.entity import (
+    DoctorEntity,
+    PatientEntity,
+    RolesEnum,
+    UserEntity,
+)
+from src.contexts.auth.domain.value_objects.email_vo import EmailVO
+from src.contexts.auth.domain.value_objects.password_hash_vo import PasswordHashVO
+
+_USER_ID = UUID(int=1)
+_BCRYPT_SAMPLE = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYJXRz.HV9K"
+
+
+def _create_doctor(**overrides):
+    return DoctorEntity.create(
+        **(
+            {
+                "user_id": _USER_ID,
+                "license_number": "MED123456",
+                "experience_years": 5,
+            }
+            | overrides
+        )
+    )
+
+
+def _create_patient(**overrides):
+    return PatientEntity.create(
+        **(
+            {
+                "user_id": _USER_ID,
+                "document": "123456789",
+                "phone": "+1234567890",
+                "birth_date": date(1990, 1, 1),
+            }
+            | overrides
+        )
+    )
+
+
+def _create_user(**overrides):
+    return UserEntity.create(
+        **(
+            {
+                "first_name": "John",
+                "last_name": "Doe",
+                "email": EmailVO("user@example.com"),
+                "password_hash": PasswordHashVO(_BCRYPT_SAMPLE),
+                "role": RolesEnum.PATIENT,
+            }
+            | overrides
+        )
+    )
+
+
+_ENTITY_FACTORIES = MappingProxyType(
+    {"doctor": _create_doctor, "patient": _create_patient, "user": _create_user}
+)
+
+
+@pytest.fixture(scope="session")
+def user_id():
+    """Return the user id the entity factories default to."""
+    return _USER_ID
+
+
+@pytest.fixture(scope="module")
+def email():
+    """Return a valid EmailVO built once per module."""
+    return EmailVO("user@example.com")
+
+
+@pytest.fixture(scope="module")
+def password_hash():
+    """Return a valid PasswordHashVO built once per module."""
+    return PasswordHashVO(_BCRYPT_SAMPLE)
+
+
+@pytest.fixture(scope="session")
+def entity_factories():
+    """Map each entity kind to a create() wrapper with valid default arguments."""
+    return _ENTITY_FACTORIES
+
+
+@pytest.fixture(scope="session")
+def create_doctor():
+    """Return a DoctorEntity.create wrapper with valid default arguments."""
+    return _create_doctor
+
+
+@pytest.fixture(scope="session")
+def create_patient():
+    """Return a PatientEntity.create wrapper with valid default arguments."""
+    return _create_patient
+
+
+@pytest.fixture(scope="session")
+def create_user():
+    """Return a UserEntity.create wrapper with valid default arguments."""
+    return _create_user
+
+
+@pytest.fixture(params=list(_ENTITY_FACTORIES), ids=list(_ENTITY_FACTORIES))
+def new_entity(request):
+    """Provide a freshly created entity of each kind."""
+    return _ENTITY_FACTORIES[request.param]()
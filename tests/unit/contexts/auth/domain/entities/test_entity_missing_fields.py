@@ -0,0 +1,43 @@
+"""Unit tests for the required-field checks of all entities."""
+
+import pytest
+
+from src.shared.domain.exceptions.exception import MissingFieldException
+
+
+@pytest.mark.parametrize(
+    "kind, overrides, field",
+    [
+        ("doctor", {"user_id": None}, "user_id"),
+        ("doctor", {"license_number": ""}, "license_number"),
+        ("doctor", {"experience_years": None}, "experience_years"),
+        ("patient", {"user_id": None}, "user_id"),
+        ("patient", {"document": ""}, "document"),
+        ("patient", {"phone": ""}, "phone"),
+        ("patient", {"birth_date": None}, "birth_date"),
+        ("user", {"first_name": ""}, "first_name"),
+        ("user", {"last_name": ""}, "last_name"),
+        ("user", {"email": None}, "email"),
+        ("user", {"password_hash": None}, "password_hash"),
+        ("user", {"role": None}, "role"),
+    ],
+    ids=[
+        "doctor-none_user_id",
+        "doctor-empty_license_number",
+        "doctor-none_experience_years",
+        "patient-none_user_id",
+        "patient-empty_document",
+        "patient-empty_phone",
+        "patient-none_birth_date",
+        "user-empty_first_name",
+        "user-empty_last_name",
+        "user-none_email",
+        "user-none_password_hash",
+        "user-none_role",
+    ],
+)
+def test_should_raise_missing_field_exception(entity_factories, kind, overrides, field):
+    """Should raise MissingFieldException naming the missing or empty field."""
+    with pytest.raises(MissingFieldException) as exc_info:
+        entity_factories[kind](**overrides)
+    assert exc_info.value.field == field
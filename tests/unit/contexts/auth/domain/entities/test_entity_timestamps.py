@@ -0,0 +1,11 @@
+"""Unit tests for the creation timestamps shared by all entities."""
+
+from datetime import UTC, datetime
+
+
+def test_should_have_equal_utc_timestamps(new_entity):
+    """Should set timezone-aware UTC created_at and updated_at to the same instant."""
+    assert isinstance(new_entity.created_at, datetime)
+    assert new_entity.created_at.tzinfo == UTC
+    assert new_entity.updated_at.tzinfo == UTC
+    assert new_entity.created_at == new_entity.updated_at
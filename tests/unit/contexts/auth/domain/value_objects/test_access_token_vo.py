@@ -1,139 +1,79 @@
 """Unit tests for AccessTokenVO."""
 
+import re
 from dataclasses import FrozenInstanceError
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
+from types import MappingProxyType
 
 import pytest
 
 from src.contexts.auth.domain.value_objects.access_token_vo import AccessTokenVO
 
+_FUTURE = datetime(2999, 1, 1, tzinfo=UTC)
+_PAST = datetime(2000, 1, 1, tzinfo=UTC)
+_DEFAULTS = MappingProxyType(
+    {
+        "access_token": "valid_token_123",
+        "token_type": "Bearer",
+        "expires_at": _FUTURE,
+        "expires_in": 3600,
+    }
+)
 
-class TestAccessTokenVO:
-    """Unit tests for AccessTokenVO."""
-
-    def test_should_create_access_token_vo_successfully(self):
-        """Should create AccessTokenVO successfully with valid data."""
-        expires_at = datetime.now(UTC) + timedelta(hours=1)
-        token = AccessTokenVO(
-            access_token="valid_token_123",
-            token_type="Bearer",
-            expires_at=expires_at,
-            expires_in=3600,
-        )
-        assert token.access_token == "valid_token_123"
-        assert token.token_type == "Bearer"
-        assert token.expires_at == expires_at
-        assert token.expires_in == 3600
 
-    def test_should_raise_value_error_for_empty_access_token(self):
-        """Should raise ValueError for empty access_token."""
-        expires_at = datetime.now(UTC) + timedelta(hours=1)
-        with pytest.raises(ValueError) as exc_info:
-            AccessTokenVO(
-                access_token="",
-                token_type="Bearer",
-                expires_at=expires_at,
-                expires_in=3600,
-            )
-        assert "access_token cannot be empty" in str(exc_info.value)
+def _make_token(**overrides):
+    """Build an AccessTokenVO from valid defaults with the given fields replaced."""
+    return AccessTokenVO(**(_DEFAULTS | overrides))
 
-    def test_should_raise_value_error_for_whitespace_access_token(self):
-        """Should raise ValueError for access_token with only whitespace."""
-        expires_at = datetime.now(UTC) + timedelta(hours=1)
-        with pytest.raises(ValueError) as exc_info:
-            AccessTokenVO(
-                access_token="   ",
-                token_type="Bearer",
-                expires_at=expires_at,
-                expires_in=3600,
-            )
-        assert "access_token cannot be empty" in str(exc_info.value)
 
-    def test_should_raise_value_error_for_invalid_token_type(self):
-        """Should raise ValueError for invalid token_type."""
-        expires_at = datetime.now(UTC) + timedelta(hours=1)
-        with pytest.raises(ValueError) as exc_info:
-            AccessTokenVO(
-                access_token="valid_token_123",
-                token_type="InvalidType",
-                expires_at=expires_at,
-                expires_in=3600,
-            )
-        assert "Invalid token_type: InvalidType" in str(exc_info.value)
+@pytest.fixture(scope="module")
+def valid_token():
+    """Return a valid AccessTokenVO built from the defaults."""
+    return _make_token()
 
-    def test_should_raise_value_error_for_negative_expires_in(self):
-        """Should raise ValueError for negative expires_in."""
-        expires_at = datetime.now(UTC) + timedelta(hours=1)
-        with pytest.raises(ValueError) as exc_info:
-            AccessTokenVO(
-                access_token="valid_token_123",
-                token_type="Bearer",
-                expires_at=expires_at,
-                expires_in=-100,
-            )
-        assert "expires_in must be positive" in str(exc_info.value)
 
-    def test_should_raise_value_error_for_zero_expires_in(self):
-        """Should raise ValueError for zero expires_in."""
-        expires_at = datetime.now(UTC) + timedelta(hours=1)
-        with pytest.raises(ValueError) as exc_info:
-            AccessTokenVO(
-                access_token="valid_token_123",
-                token_type="Bearer",
-                expires_at=expires_at,
-                expires_in=0,
-            )
-        assert "expires_in must be positive" in str(exc_info.value)
+class TestAccessTokenVO:
+    """Unit tests for AccessTokenVO."""
 
-    def test_should_raise_value_error_for_naive_datetime(self):
-        """Should raise ValueError for timezone-naive expires_at."""
-        expires_at = datetime.now()  # Naive datetime without timezone
-        with pytest.raises(ValueError) as exc_info:
-            AccessTokenVO(
-                access_token="valid_token_123",
-                token_type="Bearer",
-                expires_at=expires_at,
-                expires_in=3600,
-            )
-        assert "expires_at must be timezone-aware (UTC)" in str(exc_info.value)
+    def test_should_create_access_token_vo_successfully(self, valid_token):
+        """Should create AccessTokenVO successfully with valid data."""
+        fields = {name: getattr(valid_token, name) for name in _DEFAULTS}
+        assert fields == dict(_DEFAULTS)
 
-    def test_should_raise_value_error_for_past_expires_at(self):
-        """Should raise ValueError for expires_at in the past."""
-        expires_at = datetime.now(UTC) - timedelta(hours=1)
-        with pytest.raises(ValueError) as exc_info:
-            AccessTokenVO(
-                access_token="valid_token_123",
-                token_type="Bearer",
-                expires_at=expires_at,
-                expires_in=3600,
-            )
-        assert "expires_at must be in the future" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        ("overrides", "message"),
+        [
+            ({"access_token": ""}, "access_token cannot be empty"),
+            ({"access_token": "   "}, "access_token cannot be empty"),
+            ({"token_type": "InvalidType"}, "Invalid token_type: InvalidType"),
+            ({"expires_in": -100}, "expires_in must be positive"),
+            ({"expires_in": 0}, "expires_in must be positive"),
+            (
+                {"expires_at": datetime(2999, 1, 1)},
+                "expires_at must be timezone-aware (UTC)",
+            ),
+            ({"expires_at": _PAST}, "expires_at must be in the future"),
+        ],
+        ids=[
+            "empty_access_token",
+            "whitespace_access_token",
+            "invalid_token_type",
+            "negative_expires_in",
+            "zero_expires_in",
+            "naive_expires_at",
+            "past_expires_at",
+        ],
+    )
+    def test_should_raise_value_error_for_invalid_field(self, overrides, message):
+        """Should raise ValueError when a single field holds an invalid value."""
+        with pytest.raises(ValueError, match=re.escape(message)):
+            _make_token(**overrides)
 
-    def test_should_convert_to_dict_successfully(self):
+    def test_should_convert_to_dict_successfully(self, valid_token):
         """Should convert AccessTokenVO to dictionary successfully."""
-        expires_at = datetime.now(UTC) + timedelta(hours=1)
-        token = AccessTokenVO(
-            access_token="valid_token_123",
-            token_type="Bearer",
-            expires_at=expires_at,
-            expires_in=3600,
-        )
-        result = AccessTokenVO.to_dict(token)
-        assert result == {
-            "access_token": "valid_token_123",
-            "token_type": "Bearer",
-            "expires_at": expires_at,
-            "expires_in": 3600,
-        }
+        assert valid_token.to_dict() == dict(_DEFAULTS)
 
-    def test_should_be_frozen_dataclass(self):
+    def test_should_be_frozen_dataclass(self, valid_token):
         """Should be immutable (frozen dataclass)."""
-        expires_at = datetime.now(UTC) + timedelta(hours=1)
-        token = AccessTokenVO(
-            access_token="valid_token_123",
-            token_type="Bearer",
-            expires_at=expires_at,
-            expires_in=3600,
-        )
         with pytest.raises(FrozenInstanceError):
-            token.access_token = "new_token"
+            valid_token.access_token = "new_token"